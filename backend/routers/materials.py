@@ -48,5 +48,6 @@ def put_material_by_id(material_id:str, body:dict, repo= Depends(get_repository)
     if material is None:
         raise HTTPException(status_code=404, detail="Материал не найден")
     material.data = body
+    material.refresh_names()
     repo.save_material(material)
     return MaterialSaveResponse(ok=True, filename=material.filename)
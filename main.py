@@ -3,16 +3,22 @@ from __future__ import annotations
 
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
-import json
 import os
 import subprocess
 import uuid
-import copy
 import sys
+import time
+import functools
+import bisect
+from itertools import chain
+from operator import itemgetter
+from contextlib import contextmanager
 from datetime import datetime
 from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
 from matplotlib.patches import Ellipse, Patch
+from matplotlib.collections import PolyCollection
 import colorsys
 
 from src.services.properties_catalog import PropertiesCatalog
@@ -70,8 +76,16 @@ PROPERTIES = PropertiesCatalog()
 PHYSICAL_MAP = {k: PROPERTIES.get_meta(k) for k in PROPERTIES.physical_keys()}
 MECHANICAL_MAP = {k: PROPERTIES.get_meta(k) for k in PROPERTIES.mechanical_keys()}
 ALL_PROPERTIES_MAP = {**PHYSICAL_MAP, **MECHANICAL_MAP}
+PHYSICAL_COLUMNS = tuple(PHYSICAL_MAP)
+MECHANICAL_COLUMNS = tuple(MECHANICAL_MAP)
 HARDNESS = HardnessTable()
 
+# Общий пустой dict для цепочек .get(...) в горячих циклах (только для чтения!)
+_EMPTY = {}
+
+# Служебные ключи, не попадающие в журнал изменений
+FIND_CHANGES_IGNORED_KEYS = frozenset(("material_id", "property_last_updated"))
+
 # Константа для сравнения списков (для логов)
 LIST_ITEM_KEYS = {
     (Schema.PROPERTY_GROUPS,): Schema.PROPERTY_TYPE,
@@ -79,14 +93,15 @@ LIST_ITEM_KEYS = {
 }
 
 
-def find_changes(old_data, new_data):
+def find_changes(old_data, new_data, ignored_keys=FIND_CHANGES_IGNORED_KEYS):
     """
-    Главная функция для поиска изменений. Подготавливает данные и вызывает рекурсивный хелпер.
-    Возвращает структурированный список изменений.
+    Главная функция для поиска изменений. Обходит обе структуры без копирования и без
+    изменения входных данных; в равные поддеревья не спускается.
+    Возвращает структурированный список изменений; путь каждого изменения — кортеж ключей.
     """
 
     def list_item_key_for_path(path):
-        key = LIST_ITEM_KEYS.get(tuple(path))
+        key = LIST_ITEM_KEYS.get(path)
         if key:
             return key
         if not path:
@@ -107,10 +122,9 @@ def find_changes(old_data, new_data):
     def find_changes_recursive(d1, d2, path):
         changes = []
         if isinstance(d1, dict) and isinstance(d2, dict):
-            all_keys = sorted(list(set(d1.keys()) | set(d2.keys())))
+            all_keys = sorted((d1.keys() | d2.keys()) - ignored_keys)
             for key in all_keys:
-                if key in ["material_id", "property_last_updated"]: continue
-                new_path = path + [key]
+                new_path = path + (key,)
                 val1, val2 = d1.get(key), d2.get(key)
                 if val1 is None and val2 is not None:
                     changes.append({'path': new_path, 'type': 'added', 'new': val2})
@@ -121,35 +135,70 @@ def find_changes(old_data, new_data):
         elif isinstance(d1, list) and isinstance(d2, list):
             unique_key_name = list_item_key_for_path(path)
             is_list_of_dicts_with_key = (unique_key_name and
-                                         all(isinstance(item, dict) and unique_key_name in item for item in d1 + d2))
+                                         all(isinstance(item, dict) and unique_key_name in item
+                                             for item in chain(d1, d2)))
             if is_list_of_dicts_with_key:
                 old_map = {item[unique_key_name]: item for item in d1}
                 new_map = {item[unique_key_name]: item for item in d2}
-                all_item_keys = sorted(list(set(old_map.keys()) | set(new_map.keys())))
+                all_item_keys = sorted(old_map.keys() | new_map.keys())
                 for item_key in all_item_keys:
                     old_item = old_map.get(item_key)
                     new_item = new_map.get(item_key)
-                    item_path = path + [f"{path[-1]}[{item_key}]"]
+                    item_path = path + (f"{path[-1]}[{item_key}]",)
                     if old_item is None:
                         changes.append({'path': item_path, 'type': 'added', 'new': new_item})
                     elif new_item is None:
                         changes.append({'path': item_path, 'type': 'removed', 'old': old_item})
                     elif old_item != new_item:
                         changes.extend(find_changes_recursive(old_item, new_item, item_path))
-            else:
-                if json.dumps(d1, sort_keys=True) != json.dumps(d2, sort_keys=True):
-                    changes.append({'path': path, 'type': 'modified', 'old': d1, 'new': d2})
+            elif d1 != d2:
+                changes.append({'path': path, 'type': 'modified', 'old': d1, 'new': d2})
         elif d1 != d2:
             changes.append({'path': path, 'type': 'modified', 'old': d1, 'new': d2})
         return changes
 
-    return find_changes_recursive(copy.deepcopy(old_data), copy.deepcopy(new_data), [])
+    # Частый случай «открыл и сохранил без правок»: одно сравнение == на C вместо обхода
+    if old_data == new_data:
+        return []
+    return find_changes_recursive(old_data, new_data, ())
 
 
 # ======================================================================================
 # БЛОК 2: УТИЛИТЫ
 # ======================================================================================
 
+# Ctrl + клавиша русской раскладки -> виртуальное событие буфера обмена
+RUSSIAN_HOTKEY_EVENTS = {
+    'с': "<<Copy>>",
+    'м': "<<Paste>>",
+    'ч': "<<Cut>>",
+}
+
+
+def handle_russian_hotkeys(event):
+    """Обработчик <KeyPress> для Entry/Text/Combobox: Ctrl+С/М/Ч/Ф в русской раскладке."""
+    if not event.state & 4:
+        return None
+    key = event.keysym.lower()
+    virtual_event = RUSSIAN_HOTKEY_EVENTS.get(key)
+    if virtual_event:
+        event.widget.event_generate(virtual_event)
+        return "break"
+    if key == 'ф':
+        if isinstance(event.widget, tk.Text):
+            event.widget.tag_add("sel", "1.0", "end")
+        elif isinstance(event.widget, tk.Entry):
+            event.widget.selection_range(0, 'end')
+        return "break"
+    return None
+
+def materials_for_area(app_data, area):
+    """Материалы для фильтра «Область применения»: "Все" (или пусто) — все, иначе из индекса областей."""
+    if not area or area == "Все":
+        return app_data.materials
+    return app_data.materials_in_area(area)
+
+
 def get_username():
     try:
         return os.getlogin()
@@ -157,9 +206,23 @@ def get_username():
         return os.environ.get("USERNAME", "unknown_user")
 
 
+@functools.lru_cache(maxsize=4096)
+def format_source(main, sub):
+    """Строка источника 'основной (под-источник)'; пары повторяются у многих материалов — кэшируется."""
+    return f"{main} ({sub})" if sub else main
+
+
+@functools.lru_cache(maxsize=8)
 def read_text_from_file(filename):
-    embedded = {"app_list.txt": APP_TEXT, "instruction_list.txt": INSTR_TEXT, "change_list.txt": CHANGELOG_TEXT}
-    return embedded.get(filename, f"ОШИБКА: Не удалось прочитать '{filename}'")
+    """
+    Текст справочного файла (app_list.txt, instruction_list.txt, change_list.txt) из папки приложения.
+    Файлы не меняются во время работы, поэтому содержимое кэшируется.
+    """
+    try:
+        with open(os.path.join(get_app_directory(), filename), encoding="utf-8") as f:
+            return f.read()
+    except OSError:
+        return f"ОШИБКА: Не удалось прочитать '{filename}'"
 
 
 # Порядок вкладок редактора для аудита (отдельная строка JSON на каждую с изменениями)
@@ -357,7 +420,7 @@ def group_editor_changes_by_tab(changes):
         if not isinstance(ch, dict):
             continue
         path = ch.get("path")
-        if not isinstance(path, list) or not path:
+        if not isinstance(path, (list, tuple)) or not path:
             continue
         tab = _audit_editor_tab_for_path(path)
         if tab not in buckets:
@@ -368,36 +431,46 @@ def group_editor_changes_by_tab(changes):
 
 
 def log_changes(material_name, changes_list):
-    """Записывает изменения в лог-файл в иерархическом виде."""
+    """
+    Записывает изменения в лог-файл в иерархическом виде.
+    Строки записи собираются в список и отдаются одним writelines в буферизованный файл.
+    Строковые элементы changes_list выводятся как есть (пояснения к записи).
+    """
     if not changes_list: return
     log_path = os.path.join(get_app_directory(), LOG_FILENAME)
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     username = get_username()
+    parts = [
+        "=" * 80 + "\n",
+        f"Время: {timestamp}\n",
+        f"Пользователь: {username}\n",
+        f"Материал: {material_name}\n",
+        "Изменения:\n",
+    ]
+    printed_headers = set()
+    for change in changes_list:
+        if isinstance(change, str):
+            parts.append(f"  {change}\n")
+            continue
+        path = change['path']
+        for i in range(len(path) - 1):
+            header_path_tuple = path[:i + 1]
+            if header_path_tuple not in printed_headers:
+                indent = "  " * (i + 1)
+                header_name = path[i]
+                if isinstance(header_name, int): parts.append(f"{indent}Изменения в элементе с индексом [{header_name}]:\n")
+                else: parts.append(f"{indent}Изменения в '{header_name}':\n")
+                printed_headers.add(header_path_tuple)
+        leaf_key = path[-1]
+        indent = "  " * len(path)
+        ct = change['type']
+        if ct == 'modified': parts.append(f"{indent}- '{leaf_key}': [БЫЛО] '{change['old']}' -> [СТАЛО] '{change['new']}'\n")
+        elif ct == 'added': parts.append(f"{indent}- '{leaf_key}': [ДОБАВЛЕНО] -> '{change['new']}'\n")
+        elif ct == 'removed': parts.append(f"{indent}- '{leaf_key}': [УДАЛЕНО] (было '{change['old']}')\n")
+    parts.append("\n")
     try:
-        with open(log_path, 'a', encoding='utf-8') as f:
-            f.write("=" * 80 + "\n")
-            f.write(f"Время: {timestamp}\n")
-            f.write(f"Пользователь: {username}\n")
-            f.write(f"Материал: {material_name}\n")
-            f.write("Изменения:\n")
-            printed_headers = set()
-            for change in changes_list:
-                path = change['path']
-                for i in range(len(path) - 1):
-                    header_path_tuple = tuple(path[:i + 1])
-                    if header_path_tuple not in printed_headers:
-                        indent = "  " * (i + 1)
-                        header_name = path[i]
-                        if isinstance(header_name, int): f.write(f"{indent}Изменения в элементе с индексом [{header_name}]:\n")
-                        else: f.write(f"{indent}Изменения в '{header_name}':\n")
-                        printed_headers.add(header_path_tuple)
-                leaf_key = path[-1]
-                indent = "  " * len(path)
-                ct = change['type']
-                if ct == 'modified': f.write(f"{indent}- '{leaf_key}': [БЫЛО] '{change['old']}' -> [СТАЛО] '{change['new']}'\n")
-                elif ct == 'added': f.write(f"{indent}- '{leaf_key}': [ДОБАВЛЕНО] -> '{change['new']}'\n")
-                elif ct == 'removed': f.write(f"{indent}- '{leaf_key}': [УДАЛЕНО] (было '{change['old']}')\n")
-            f.write("\n")
+        with open(log_path, 'a', encoding='utf-8', buffering=64 * 1024) as f:
+            f.writelines(parts)
     except Exception as e:
         print(f"Ошибка записи в лог-файл: {e}")
 
@@ -416,21 +489,90 @@ def safe_float(value, default=None):
         return default
 
 
+# Открытие файла/ссылки системным приложением; платформа выбирается один раз при импорте
+if sys.platform == "win32":
+    open_with_system = os.startfile
+elif sys.platform == "darwin":
+    def open_with_system(path):
+        subprocess.call(["open", path])
+else:
+    def open_with_system(path):
+        subprocess.call(["xdg-open", path])
+
+
+# Кэш содержимого папок с файлами источников: directory -> (момент чтения, имена)
+_DIR_LISTING_CACHE = {}
+_DIR_LISTING_TTL = 1.0
+
+
+def list_dir_names(directory):
+    """
+    Имена записей папки за один os.scandir (в os.path.normcase).
+    Результат кэшируется на _DIR_LISTING_TTL секунд; отсутствующая папка — пустое множество.
+    """
+    now = time.monotonic()
+    cached = _DIR_LISTING_CACHE.get(directory)
+    if cached and now - cached[0] < _DIR_LISTING_TTL:
+        return cached[1]
+    try:
+        with os.scandir(directory) as it:
+            names = {os.path.normcase(entry.name) for entry in it}
+    except OSError:
+        names = set()
+    _DIR_LISTING_CACHE[directory] = (now, names)
+    return names
+
+
+# Негативный кэш: (directory, relative_path) -> момент, когда файла не оказалось
+_MISSING_PATH_CACHE = {}
+
+
+def path_exists_in(directory, relative_path):
+    """Проверка существования directory/relative_path; отсутствие помним _DIR_LISTING_TTL секунд."""
+    key = (directory, relative_path)
+    now = time.monotonic()
+    missing_at = _MISSING_PATH_CACHE.get(key)
+    if missing_at is not None and now - missing_at < _DIR_LISTING_TTL:
+        return False
+    # access(F_OK) не заполняет stat-структуру — для проверки существования этого достаточно
+    if os.access(os.path.join(directory, relative_path), os.F_OK):
+        _MISSING_PATH_CACHE.pop(key, None)
+        return True
+    _MISSING_PATH_CACHE[key] = now
+    return False
+
+
 class ScrollableMixin:
     """Миксин для прокрутки колесом мыши."""
+    # bindtag -> прокручиваемый виджет, для которого тег уже привязан
+    _wheel_targets = {}
+
     def bind_mouse_wheel(self, widget, target_widget=None):
+        """
+        Обработчик колеса привязывается один раз на целевой виджет через общий bindtag,
+        а виджету лишь добавляется этот тег (без новых Tcl-команд на каждый виджет).
+        """
         target = target_widget if target_widget else widget
-        def _on_mousewheel(event):
-            if isinstance(event.widget, ttk.Combobox): pass
-            if hasattr(event, 'delta') and event.delta != 0:
-                target.yview_scroll(int(-1 * (event.delta / 120)), "units")
-            elif hasattr(event, 'num'):
-                if event.num == 4: target.yview_scroll(-1, "units")
-                elif event.num == 5: target.yview_scroll(1, "units")
-            return "break"
-        widget.bind("<MouseWheel>", _on_mousewheel)
-        widget.bind("<Button-4>", _on_mousewheel)
-        widget.bind("<Button-5>", _on_mousewheel)
+        tag = f"WheelScroll{target}"
+        if ScrollableMixin._wheel_targets.get(tag) is not target:
+            def _on_mousewheel(event):
+                if hasattr(event, 'delta') and event.delta != 0:
+                    target.yview_scroll(int(-1 * (event.delta / 120)), "units")
+                elif hasattr(event, 'num'):
+                    if event.num == 4: target.yview_scroll(-1, "units")
+                    elif event.num == 5: target.yview_scroll(1, "units")
+                return "break"
+            widget.bind_class(tag, "<MouseWheel>", _on_mousewheel)
+            widget.bind_class(tag, "<Button-4>", _on_mousewheel)
+            widget.bind_class(tag, "<Button-5>", _on_mousewheel)
+            ScrollableMixin._wheel_targets[tag] = target
+
+        tags = widget.bindtags()
+        if tag not in tags:
+            # Как и повторный bind, новая цель заменяет прежнюю; тег ставится сразу после
+            # собственного тега виджета — чтобы "break" срабатывал до классовых привязок
+            tags = tuple(t for t in tags if not t.startswith("WheelScroll"))
+            widget.bindtags(tags[:1] + (tag,) + tags[1:])
 
     def bind_all_children(self, parent_widget, target_canvas):
         self.bind_mouse_wheel(parent_widget, target_canvas)
@@ -894,6 +1036,40 @@ class UnitManager:
             return list(UnitManager.REGISTRY[type_name]["factors"].keys())
         return []
 
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def get_default_unit(base_unit, type_name):
+        """
+        Единица отображения колонки по умолчанию: base_unit, если он есть среди единиц типа,
+        иначе системная единица типа. Проверка идёт по dict factors, без сборки списка единиц.
+        """
+        if not type_name:
+            return base_unit
+        cfg = UnitManager.REGISTRY.get(type_name)
+        if cfg and base_unit in cfg["factors"]:
+            return base_unit
+        return UnitManager.get_system_unit(type_name)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def get_linear_factor(from_unit, to_unit, type_name):
+        """
+        Множитель k такой, что from_system(to_system(v, from_unit), to_unit) == v * k,
+        или None, если перевод нелинейный (твердость, смещения температурных шкал).
+        Позволяет один раз найти коэффициент на колонку вместо двух поисков на каждое значение.
+        REGISTRY не меняется во время работы, поэтому результат кэшируется.
+        """
+        if type_name == "Твердость":
+            return None
+        cfg = UnitManager.REGISTRY.get(type_name)
+        if not cfg:
+            return 1.0
+        f_from = cfg["factors"].get(from_unit, 1.0)
+        f_to = cfg["factors"].get(to_unit, 1.0)
+        if isinstance(f_from, str) or isinstance(f_to, str):
+            return None
+        return f_from / f_to
+
     # --- ЛОГИКА ИНТЕРПОЛЯЦИИ ТВЕРДОСТИ (ИСПРАВЛЕННАЯ) ---
 
 
@@ -989,48 +1165,105 @@ class Tooltip:
         self.text = text
         self.delay = delay
         self.tip_window = None
+        self.label = None
         self.id = None
         self.widget.bind("<Enter>", self.schedule_tip)
         self.widget.bind("<Leave>", self.hide_tip)
     def schedule_tip(self, event=None):
         self.id = self.widget.after(self.delay, self.show_tip)
     def show_tip(self, event=None):
-        if self.tip_window or not self.text: return
+        self.id = None
+        if not self.text: return
         x, y, _, _ = self.widget.bbox("insert")
         x += self.widget.winfo_rootx() + 25
         y += self.widget.winfo_rooty() + 20
-        self.tip_window = tk.Toplevel(self.widget)
-        self.tip_window.wm_overrideredirect(True)
+        # Окно подсказки создаётся один раз, дальше только прячется/показывается
+        if self.tip_window is None:
+            self.tip_window = tk.Toplevel(self.widget)
+            self.tip_window.wm_overrideredirect(True)
+            self.label = tk.Label(self.tip_window, justify=tk.LEFT,
+                                  background="#ffffe0", relief=tk.SOLID, borderwidth=1,
+                                  font=("TkDefaultFont", 10, "normal"), wraplength=300)
+            self.label.pack(ipadx=5, ipady=3)
+        self.label.configure(text=self.text)
         self.tip_window.wm_geometry(f"+{x}+{y}")
-        label = tk.Label(self.tip_window, text=self.text, justify=tk.LEFT,
-                         background="#ffffe0", relief=tk.SOLID, borderwidth=1,
-                         font=("TkDefaultFont", 10, "normal"), wraplength=300)
-        label.pack(ipadx=5, ipady=3)
+        self.tip_window.wm_deiconify()
     def hide_tip(self, event=None):
         if self.id: self.widget.after_cancel(self.id); self.id = None
-        if self.tip_window: self.tip_window.destroy(); self.tip_window = None
+        if self.tip_window: self.tip_window.wm_withdraw()
+
 
+def add_bindtag_recursive(widget, tag):
+    """Вставляет tag в bindtags виджета и всех его потомков (сразу после тега самого виджета)."""
+    tags = widget.bindtags()
+    widget.bindtags(tags[:1] + (tag,) + tags[1:])
+    for child in widget.winfo_children():
+        add_bindtag_recursive(child, tag)
 
-def create_editable_treeview(parent_frame, on_update_callback=None):
+
+def refill_treeview(tree, rows):
+    """
+    Заменяет все строки дерева: очистка одним вызовом delete и вставка подряд.
+    Возвращает id вставленных строк в порядке rows.
+    """
+    children = tree.get_children()
+    if children:
+        tree.delete(*children)
+    # Прямой вызов Tcl-команды дерева: без разбора опций ttk.Treeview.insert на каждую строку.
+    # Ячейки передаются строками, как их отдавал ttk.Treeview.insert: иначе Tcl хранит
+    # типизированный список и item(..., "values") возвращает float/int вместо str
+    call = tree.tk.call
+    path = str(tree)
+    return [
+        call(path, "insert", "", "end", "-values", tuple("" if v is None else str(v) for v in row))
+        for row in rows
+    ]
+
+
+def create_editable_treeview(parent_frame, on_update_callback=None, on_item_update=None):
+    """
+    Treeview с редактированием ячеек по двойному клику.
+    on_update_callback() вызывается после каждой правки; on_item_update(item_id) —
+    то же, но с id изменённой строки (для точечного обновления кэшей).
+    """
     tree = ttk.Treeview(parent_frame)
+    # Одно поле ввода на дерево: создаётся при первом редактировании и дальше только
+    # перемещается (place/place_forget), а не пересоздаётся на каждую ячейку.
+    editor = {"entry": None, "var": None, "target": None}
+
+    def commit_edit(event=None):
+        target = editor["target"]
+        if target is None:  # Return уже зафиксировал правку, FocusOut после place_forget игнорируем
+            return
+        editor["target"] = None
+        item_id, column = target
+        if tree.exists(item_id):
+            tree.set(item_id, column, editor["var"].get())
+        editor["entry"].place_forget()
+        if on_item_update: on_item_update(item_id)
+        if on_update_callback: on_update_callback()
+
     def on_tree_double_click(event):
         region = tree.identify("region", event.x, event.y)
         if region != "cell": return
         item_id = tree.focus()
         column = tree.identify_column(event.x)
-        x, y, width, height = tree.bbox(item_id, column)
-        entry_var = tk.StringVar()
-        entry = ttk.Entry(tree, textvariable=entry_var)
-        entry_var.set(tree.set(item_id, column))
+        bbox = tree.bbox(item_id, column)
+        if not bbox: return
+        if editor["target"] is not None:
+            commit_edit()
+        entry = editor["entry"]
+        if entry is None:
+            editor["var"] = tk.StringVar()
+            entry = editor["entry"] = ttk.Entry(tree, textvariable=editor["var"])
+            entry.bind("<FocusOut>", commit_edit)
+            entry.bind("<Return>", commit_edit)
+        x, y, width, height = bbox
+        editor["var"].set(tree.set(item_id, column))
+        editor["target"] = (item_id, column)
         entry.place(x=x, y=y, width=width, height=height)
         entry.focus_set()
         entry.selection_range(0, tk.END)
-        def on_focus_out(event):
-            tree.set(item_id, column, entry_var.get())
-            entry.destroy()
-            if on_update_callback: on_update_callback()
-        entry.bind("<FocusOut>", on_focus_out)
-        entry.bind("<Return>", lambda e: on_focus_out(e))
     tree.bind("<Double-1>", on_tree_double_click)
     return tree
 
@@ -1043,11 +1276,17 @@ def create_editable_treeview(parent_frame, on_update_callback=None):
 class TempSelectionTab(ttk.Frame, ScrollableMixin):
     """Вкладка 'Подбор по температуре' с фиксированными колонками и синхронным скроллом."""
 
+    FROZEN_COLUMNS = ("material_name", "strength_category", "source", "max_temp")
+
     def __init__(self, parent, app_data, main_app=None):
         super().__init__(parent)
         self.app_data = app_data
         self.main_app = main_app
         self.treeview_data = []
+        # колонка -> {id(строки): ключ сортировки}; сбрасывается при каждом пересчёте таблицы
+        self._sort_keys = {}
+        # id(строки) -> iid строки в tree_frozen/tree_scrollable (заполняется в _populate_treeview)
+        self._row_iids = {}
         self.column_units = {}
         self.PROP_TYPES = ["Физические свойства", "Механические свойства", "Твердость"]
         self.PROPERTY_COLUMN_WIDTH = 100
@@ -1058,6 +1297,12 @@ class TempSelectionTab(ttk.Frame, ScrollableMixin):
             # чтобы по ПКМ вызывать меню выбора единиц.
             "unit_value": {"name": "Ед. изм.", "width": self.PROPERTY_COLUMN_WIDTH, "unit_type": "Твердость"}
         }
+        self.HARDNESS_COLUMN_KEYS = tuple(self.HARDNESS_COLUMNS)
+        # Текущие колонки tree_scrollable (чтобы не опрашивать виджет при каждом пересчёте)
+        self._scrollable_columns = ()
+        # Последний разобранный текст поля температуры и его значение
+        self._last_temp_text = None
+        self._last_temp_value = 0.0
         self._after_id = None
         style = ttk.Style()
         style.configure("Treeview.Heading", padding=(5, 5), wraplength=120, font=('TkDefaultFont', 9))
@@ -1093,8 +1338,7 @@ class TempSelectionTab(ttk.Frame, ScrollableMixin):
         tree_container.grid_rowconfigure(0, weight=1)
         tree_container.grid_columnconfigure(1, weight=1)
 
-        frozen_columns = ["material_name", "strength_category", "source", "max_temp"]
-        self.tree_frozen = ttk.Treeview(tree_container, columns=frozen_columns, show="headings")
+        self.tree_frozen = ttk.Treeview(tree_container, columns=self.FROZEN_COLUMNS, show="headings")
         self.tree_scrollable = ttk.Treeview(tree_container, columns=[], show="headings")
 
         self.tree_frozen.grid(row=0, column=0, sticky="nswe")
@@ -1121,6 +1365,7 @@ class TempSelectionTab(ttk.Frame, ScrollableMixin):
         vsb.grid(row=0, column=2, sticky="ns")
         hsb = ttk.Scrollbar(tree_container, orient="horizontal", command=self.tree_scrollable.xview)
         hsb.grid(row=1, column=1, sticky="ew")
+        self._vsb = vsb
 
         self.tree_frozen.configure(yscrollcommand=vsb.set)
         self.tree_scrollable.configure(yscrollcommand=vsb.set, xscrollcommand=hsb.set)
@@ -1171,20 +1416,18 @@ class TempSelectionTab(ttk.Frame, ScrollableMixin):
         elif prop_type == "Твердость":
             prop_map = self.HARDNESS_COLUMNS
 
-        new_columns = list(prop_map.keys())
+        if prop_map is PHYSICAL_MAP:
+            new_columns = PHYSICAL_COLUMNS
+        elif prop_map is MECHANICAL_MAP:
+            new_columns = MECHANICAL_COLUMNS
+        else:
+            new_columns = self.HARDNESS_COLUMN_KEYS if prop_map else ()
         self.tree_scrollable["columns"] = new_columns
+        self._scrollable_columns = new_columns
 
         for prop_key, prop_info in prop_map.items():
-            base_unit = prop_info.get('unit', '')
-            unit_type = prop_info.get("unit_type")
-            if unit_type:
-                available = UnitManager.get_units(unit_type)
-                if base_unit in available:
-                    self.column_units[prop_key] = base_unit
-                else:
-                    self.column_units[prop_key] = UnitManager.get_system_unit(unit_type)
-            else:
-                self.column_units[prop_key] = base_unit
+            self.column_units[prop_key] = UnitManager.get_default_unit(
+                prop_info.get('unit', ''), prop_info.get("unit_type"))
 
             self._update_column_header(prop_key, prop_info)
             self.tree_scrollable.column(prop_key, width=self.PROPERTY_COLUMN_WIDTH, minwidth=80, anchor="center")
@@ -1210,7 +1453,7 @@ class TempSelectionTab(ttk.Frame, ScrollableMixin):
         if region == "heading":
             col_id = self.tree_scrollable.identify_column(event.x)
             col_index = int(col_id.replace('#', '')) - 1
-            columns = self.tree_scrollable["columns"]
+            columns = self._scrollable_columns
             if 0 <= col_index < len(columns):
                 self._show_header_unit_menu(event, columns[col_index])
         else:
@@ -1264,7 +1507,7 @@ class TempSelectionTab(ttk.Frame, ScrollableMixin):
 
     def _get_value_from_prop_data(self, prop_data, temp):
         if not prop_data or "temperature_value_pairs" not in prop_data: return None
-        pairs = sorted(prop_data.get("temperature_value_pairs", []), key=lambda p: p[0])
+        pairs = sorted(prop_data.get("temperature_value_pairs", []), key=itemgetter(0))
         if not pairs: return None
         for t, val in pairs:
             if t == temp: return float(val)
@@ -1288,36 +1531,40 @@ class TempSelectionTab(ttk.Frame, ScrollableMixin):
 
     def _on_calculate(self):
         selected_prop_type = self.prop_type_combo.get()
-        current_cols = self.tree_scrollable["columns"]
 
         is_phys = (selected_prop_type == "Физические свойства")
         is_mech = (selected_prop_type == "Механические свойства")
         is_hard = (selected_prop_type == "Твердость")
 
-        prop_map = {}
+        prop_cols = ()
         if is_phys:
-            prop_map = PHYSICAL_MAP
+            prop_cols = PHYSICAL_COLUMNS
         elif is_mech:
-            prop_map = MECHANICAL_MAP
+            prop_cols = MECHANICAL_COLUMNS
         elif is_hard:
-            prop_map = self.HARDNESS_COLUMNS
+            prop_cols = self.HARDNESS_COLUMN_KEYS
 
-        if list(current_cols) != list(prop_map.keys()):
+        if self._scrollable_columns != prop_cols:
             self._reconfigure_scrollable_treeview(selected_prop_type)
 
-        temp = MathUtils.safe_float(self.temp_entry.get(), default=0.0)
+        temp_text = self.temp_entry.get()
+        if temp_text == self._last_temp_text:
+            temp = self._last_temp_value
+        else:
+            temp = MathUtils.safe_float(temp_text, default=0.0)
+            self._last_temp_text, self._last_temp_value = temp_text, temp
         selected_area = self.area_combo.get()
 
-        filtered_materials = [
-            m for m in self.app_data.materials
-            if selected_area == "Все" or selected_area in m.data.get(Schema.METADATA, {}).get(Schema.APP_AREA, [])
-        ]
-
         self.treeview_data = []
+        self._sort_keys = {}
+        prop_keys = prop_cols
+        source_manager = self.app_data.source_manager
 
-        for mat in filtered_materials:
-            max_app_temp = mat.data.get(Schema.METADATA, {}).get("temperature_application", {}).get("value", "-")
+        for mat in materials_for_area(self.app_data, selected_area):
+            meta = mat.data.get(Schema.METADATA) or _EMPTY
+            max_app_temp = (meta.get("temperature_application") or _EMPTY).get("value", "-")
             cats = mat.get_strength_categories()
+            mat_name = mat.get_display_name()
 
             if is_hard:
                 # Логика твердости сложная, оставляем ручной перебор, но через константы
@@ -1325,61 +1572,56 @@ class TempSelectionTab(ttk.Frame, ScrollableMixin):
                     for cat in cats:
                         h_list = Material.get_hardness_entries(cat)
                         if h_list:
+                            cat_name = Material.category_name(cat) or "N/A"
                             for h in h_list:
-                                src = h.get("property_source", "") + (
-                                    f" ({h.get('property_subsource')})" if h.get("property_subsource") else "")
+                                src = format_source(h.get("property_source", ""), h.get("property_subsource"))
                                 self.treeview_data.append({
-                                    "material_name": mat.get_display_name(), "obj": mat,
-                                    "strength_category": Material.category_name(cat) or "N/A",
+                                    "material_name": mat_name, "obj": mat,
+                                    "strength_category": cat_name,
                                     "source": src or "-", "max_temp": max_app_temp,
                                     "min_value": h.get("min_value"), "max_value": h.get("max_value"),
                                     "unit_value": h.get("unit_value", "-")
                                 })
                         else:
-                            self.treeview_data.append({"material_name": mat.get_display_name(),
+                            self.treeview_data.append({"material_name": mat_name,
                                                        "strength_category": Material.category_name(cat), "source": "-",
                                                        "max_temp": max_app_temp, "min_value": None})
                 else:
                     self.treeview_data.append(
-                        {"material_name": mat.get_display_name(), "strength_category": "-", "source": "-",
+                        {"material_name": mat_name, "strength_category": "-", "source": "-",
                          "max_temp": max_app_temp, "min_value": None})
             else:
                 # Физические и Механические
                 if cats and not is_phys:  # Для механики разбиваем по категориям
                     for i, cat in enumerate(cats):
                         source_str = mat.get_source_info(Schema.MECHANICAL if is_mech else Schema.PHYSICAL,
-                                                         category_idx=i, source_manager=self.app_data.source_manager)
+                                                         category_idx=i, source_manager=source_manager)
                         row = {
-                            "material_name": mat.get_display_name(), "obj": mat,
+                            "material_name": mat_name, "obj": mat,
                             "strength_category": Material.category_name(cat) or "N/A",
                             "source": source_str, "max_temp": max_app_temp
                         }
-                        for prop_key in prop_map:
-                            # ! ВЫЗОВ НОВОГО МЕТОДА !
-                            val = mat.get_interpolated_property(prop_key, temp, category_idx=i)
-                            row[prop_key] = val
+                        row.update(mat.get_interpolated_properties(prop_keys, temp, category_idx=i))
                         self.treeview_data.append(row)
                 else:
                     # Физ свойства (одна строка на материал)
-                    source_str = mat.get_source_info(Schema.PHYSICAL, source_manager=self.app_data.source_manager)
+                    source_str = mat.get_source_info(Schema.PHYSICAL, source_manager=source_manager)
                     row = {
-                        "material_name": mat.get_display_name(), "obj": mat,
+                        "material_name": mat_name, "obj": mat,
                         "strength_category": "-", "source": source_str, "max_temp": max_app_temp
                     }
-                    for prop_key in prop_map:
-                        # ! ВЫЗОВ НОВОГО МЕТОДА !
-                        val = mat.get_interpolated_property(prop_key, temp)
-                        row[prop_key] = val
+                    row.update(mat.get_interpolated_properties(prop_keys, temp))
                     self.treeview_data.append(row)
 
         self._populate_treeview()
 
     def _populate_treeview(self):
-        for i in self.tree_frozen.get_children(): self.tree_frozen.delete(i)
-        for i in self.tree_scrollable.get_children(): self.tree_scrollable.delete(i)
+        tree_frozen, tree_scrollable = self.tree_frozen, self.tree_scrollable
+        tree_frozen.delete(*tree_frozen.get_children())
+        tree_scrollable.delete(*tree_scrollable.get_children())
 
-        scrollable_cols = self.tree_scrollable["columns"]
-        frozen_cols = self.tree_frozen["columns"]
+        scrollable_cols = self._scrollable_columns
+        frozen_cols = self.FROZEN_COLUMNS
 
         prop_map = {}
         current_type = self.prop_type_combo.get()
@@ -1389,8 +1631,28 @@ class TempSelectionTab(ttk.Frame, ScrollableMixin):
             prop_map = MECHANICAL_MAP
         elif current_type == "Твердость":
             prop_map = self.HARDNESS_COLUMNS
-
-        for row in self.treeview_data:
+        is_hard = current_type == "Твердость"
+        column_units = self.column_units
+
+        # Линейные переводы единиц сводятся к одному множителю на колонку
+        linear_factors = {}
+        for col_key in scrollable_cols:
+            prop_info = prop_map.get(col_key)
+            if prop_info and prop_info.get("unit_type") and prop_info.get("unit"):
+                source_unit = prop_info["unit"]
+                target_unit = column_units.get(col_key, source_unit)
+                if target_unit:
+                    factor = UnitManager.get_linear_factor(source_unit, target_unit, prop_info["unit_type"])
+                    if factor is not None:
+                        linear_factors[col_key] = factor
+
+        # На время заполнения отключаем скроллбар: иначе каждая вставка дёргает vsb.set
+        tree_frozen.configure(yscrollcommand="")
+        tree_scrollable.configure(yscrollcommand="")
+        # Строка данных -> iid (одинаковый в обоих деревьях): сортировка потом лишь переставляет строки
+        row_iids = self._row_iids = {}
+        for index, row in enumerate(self.treeview_data):
+            iid = row_iids[id(row)] = str(index)
             frozen_values = [str(row.get(c, "-") if row.get(c) is not None else "-") for c in frozen_cols]
             scrollable_values = []
             for col_key in scrollable_cols:
@@ -1398,8 +1660,8 @@ class TempSelectionTab(ttk.Frame, ScrollableMixin):
                 if col_key == "unit_value":
                     # Для твердости показываем выбранную единицу отображения,
                     # а не исходную из БД.
-                    if self.prop_type_combo.get() == "Твердость":
-                        unit = self.column_units.get(col_key) or UnitManager.get_system_unit("Твердость")
+                    if is_hard:
+                        unit = column_units.get(col_key) or UnitManager.get_system_unit("Твердость")
                         scrollable_values.append(unit)
                     else:
                         scrollable_values.append(str(raw_val) if raw_val else "-")
@@ -1408,12 +1670,19 @@ class TempSelectionTab(ttk.Frame, ScrollableMixin):
                     scrollable_values.append("-")
                     continue
 
+                factor = linear_factors.get(col_key)
+                if factor is not None:
+                    # Точное совпадение по T отдаёт значение пары как есть — оно может быть строкой
+                    num_val = safe_float(raw_val)
+                    scrollable_values.append("-" if num_val is None else f"{num_val * factor:.2f}")
+                    continue
+
                 prop_info = prop_map.get(col_key)
                 if prop_info and "unit_type" in prop_info:
                     unit_type = prop_info["unit_type"]
                     source_unit = prop_info.get("unit")
                     if unit_type == "Твердость": source_unit = row.get("unit_value")
-                    target_unit = self.column_units.get(col_key, source_unit)
+                    target_unit = column_units.get(col_key, source_unit)
 
                     if source_unit and target_unit and unit_type:
                         try:
@@ -1427,19 +1696,30 @@ class TempSelectionTab(ttk.Frame, ScrollableMixin):
                 else:
                     scrollable_values.append(f"{raw_val:.2f}")
 
-            self.tree_frozen.insert("", "end", values=frozen_values)
-            self.tree_scrollable.insert("", "end", values=scrollable_values)
+            tree_frozen.insert("", "end", iid=iid, values=frozen_values)
+            tree_scrollable.insert("", "end", iid=iid, values=scrollable_values)
+        tree_frozen.configure(yscrollcommand=self._vsb.set)
+        tree_scrollable.configure(yscrollcommand=self._vsb.set)
 
-    def _sort_column(self, col, reverse):
-        def get_sort_key(item):
-            value = item.get(col)
-            if value is None: return (2, None)
-            if isinstance(value, (int, float)): return (0, value)
-            return (1, str(value).lower())
+    @staticmethod
+    def _make_sort_key(value):
+        if value is None: return (2, 0)
+        num = safe_float(value)
+        if num is not None: return (0, num)
+        return (1, str(value).lower())
 
-        self.treeview_data.sort(key=get_sort_key, reverse=reverse)
-        self._populate_treeview()
-        tree_to_bind = self.tree_frozen if col in self.tree_frozen['columns'] else self.tree_scrollable
+    def _sort_column(self, col, reverse):
+        # Ключи (с разбором чисел) считаются один раз на колонку, повторные клики их переиспользуют
+        keys = self._sort_keys.get(col)
+        if keys is None:
+            make_key = self._make_sort_key
+            keys = self._sort_keys[col] = {id(row): make_key(row.get(col)) for row in self.treeview_data}
+        self.treeview_data.sort(key=lambda row: keys[id(row)], reverse=reverse)
+        # Значения ячеек от порядка не зависят: переставляем готовые строки одним вызовом на дерево
+        order = [self._row_iids[id(row)] for row in self.treeview_data]
+        self.tree_frozen.set_children("", *order)
+        self.tree_scrollable.set_children("", *order)
+        tree_to_bind = self.tree_frozen if col in self.FROZEN_COLUMNS else self.tree_scrollable
         tree_to_bind.heading(col, command=lambda: self._sort_column(col, not reverse))
 
     def update_comboboxes(self):
@@ -1494,6 +1774,8 @@ class SingleCalculationTab(ttk.Frame, ScrollableMixin):
         self.SCALAR_KEYS = [k for k in self.ALL_KEYS if not PROPERTIES.supports_temperature(k)]
         self.db_data_rows = []
         self.custom_temps = []
+        # (id материала, индекс КП, T) -> строка расчёта; сбрасывается при перезагрузке данных
+        self._custom_row_cache = {}
         style = ttk.Style()
         style.configure("BigHeader.Treeview.Heading", padding=(5, 10, 5, 10), font=('TkDefaultFont', 9, 'bold'))
         style.configure("BigHeader.Treeview", rowheight=25)
@@ -1626,6 +1908,7 @@ class SingleCalculationTab(ttk.Frame, ScrollableMixin):
     # --- ЛОГИКА ---
 
     def update_comboboxes(self):
+        self._custom_row_cache.clear()
         areas = ["Все"] + self.app_data.application_areas
         self.area_combo.config(values=areas)
         if not self.area_combo.get():
@@ -1634,10 +1917,7 @@ class SingleCalculationTab(ttk.Frame, ScrollableMixin):
 
     def _filter_materials(self, event=None):
         selected_area = self.area_combo.get()
-        mats = []
-        for m in self.app_data.materials:
-            if selected_area == "Все" or selected_area in m.data.get("metadata", {}).get("application_area", []):
-                mats.append(m.get_display_name())
+        mats = [m.get_display_name() for m in materials_for_area(self.app_data, selected_area)]
 
         self.material_combo.config(values=mats)
         if mats:
@@ -1650,7 +1930,7 @@ class SingleCalculationTab(ttk.Frame, ScrollableMixin):
 
     def _on_material_select(self, event=None):
         mat_name = self.material_combo.get()
-        material = next((m for m in self.app_data.materials if m.get_display_name() == mat_name), None)
+        material = self.app_data.get_by_display_name(mat_name)
         if not material:
             return
 
@@ -1681,55 +1961,38 @@ class SingleCalculationTab(ttk.Frame, ScrollableMixin):
                 "approx" (линейная экстраполяция по двум ближайшим точкам),
                 либо None, если значение не может быть определено.
         """
-        data_container = None
-
-        # Определяем, откуда брать пары температур для свойства
-        if PROPERTIES.is_physical(prop_key):
-            data_container = material.get_physical_data(prop_key)
-        elif PROPERTIES.is_mechanical(prop_key):
-            cats = material.get_strength_categories()
-            if cat_idx is not None and 0 <= cat_idx < len(cats):
-                data_container = Material.get_category_prop_data(cats[cat_idx], prop_key)
-        else:
-            return None, None
+        return self._value_at(self._get_points(material, prop_key, cat_idx), temp, allow_extrapolation)
 
+    def _get_points(self, material, prop_key, cat_idx=None):
+        """Числовые точки (t, v) свойства, отсортированные по t; пустой список, если данных нет."""
+        data_container = self._get_property_container(material, prop_key, cat_idx)
         if not data_container:
-            return None, None
-
-        pairs = data_container.get(Schema.TEMP_PAIRS, [])
-        if not pairs:
-            return None, None
-
-        points = []
-        for t_raw, v_raw in pairs:
-            t_val = safe_float(t_raw)
-            v_val = safe_float(v_raw)
-            if t_val is not None and v_val is not None:
-                points.append((t_val, v_val))
+            return []
+        return material.get_numeric_points(data_container)
 
+    @staticmethod
+    def _value_at(points, temp, allow_extrapolation=False):
+        """(value, mode) по готовым точкам свойства; см. _get_value_with_mode."""
         if not points:
             return None, None
 
-        points.sort(key=lambda p: p[0])
-        xs = [p[0] for p in points]
-        min_x, max_x = xs[0], xs[-1]
+        min_x, max_x = points[0][0], points[-1][0]
+
+        # Первая точка с x >= temp: (temp,) меньше любого (temp, y), точки отсортированы по x
+        i = bisect.bisect_left(points, (temp,))
 
         # 1. Точное совпадение
-        for x, y in points:
-            if x == temp:
-                return y, "exact"
+        if i < len(points) and points[i][0] == temp:
+            return points[i][1], "exact"
 
-        # 2. Внутри диапазона — интерполяция
+        # 2. Внутри диапазона — интерполяция между соседями
         if min_x < temp < max_x:
-            for i in range(len(points) - 1):
-                x1, y1 = points[i]
-                x2, y2 = points[i + 1]
-                if x1 <= temp <= x2:
-                    if x2 == x1:
-                        return y1, "interp"
-                    val = y1 + (temp - x1) * (y2 - y1) / (x2 - x1)
-                    return val, "interp"
-            return None, None
+            x1, y1 = points[i - 1]
+            x2, y2 = points[i]
+            if x2 == x1:
+                return y1, "interp"
+            val = y1 + (temp - x1) * (y2 - y1) / (x2 - x1)
+            return val, "interp"
 
         # 3. Вне диапазона
         if not allow_extrapolation:
@@ -1778,7 +2041,7 @@ class SingleCalculationTab(ttk.Frame, ScrollableMixin):
     def _calculate_db_rows(self):
         """Сбор данных из БД (без экстраполяции, только точные точки и интерполяция)."""
         mat_name = self.material_combo.get()
-        material = next((m for m in self.app_data.materials if m.get_display_name() == mat_name), None)
+        material = self.app_data.get_by_display_name(mat_name)
         if not material:
             return
 
@@ -1808,16 +2071,13 @@ class SingleCalculationTab(ttk.Frame, ScrollableMixin):
                 row[prop_key] = {"value": scalar_values.get(prop_key), "mode": "scalar"}
             self.db_data_rows.append(row)
 
+        # Точки каждого свойства находим один раз, а не на каждую температуру
+        points_by_key = [(pk, self._get_points(material, pk, cat_idx_arg)) for pk in self.TEMP_KEYS]
+        value_at = self._value_at
         for t in sorted_temps:
             row = {"temp": t}
-            for prop_key in self.TEMP_KEYS:
-                value, mode = self._get_value_with_mode(
-                    material,
-                    prop_key,
-                    t,
-                    cat_idx=cat_idx_arg,
-                    allow_extrapolation=False
-                )
+            for prop_key, points in points_by_key:
+                value, mode = value_at(points, t, allow_extrapolation=False)
                 row[prop_key] = {"value": value, "mode": mode}
             for prop_key in self.SCALAR_KEYS:
                 row[prop_key] = {"value": scalar_values.get(prop_key), "mode": "scalar"}
@@ -1832,13 +2092,20 @@ class SingleCalculationTab(ttk.Frame, ScrollableMixin):
         {"value": float|None, "mode": "exact"/"interp"/"approx"|None}.
         """
         mat_name = self.material_combo.get()
-        material = next((m for m in self.app_data.materials if m.get_display_name() == mat_name), None)
+        material = self.app_data.get_by_display_name(mat_name)
         if not material:
             return {"temp": temp}
 
         cat_idx = self.category_combo.current()
         cat_idx_arg = cat_idx if cat_idx != -1 else None
 
+        # Таблица перерисовывается целиком при смене единиц/колонок/добавлении строки —
+        # уже посчитанные точки берём из кэша
+        cache_key = (id(material), cat_idx_arg, temp)
+        cached = self._custom_row_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         row = {"temp": temp}
         for prop_key in self.TEMP_KEYS:
             value, mode = self._get_value_with_mode(
@@ -1854,6 +2121,7 @@ class SingleCalculationTab(ttk.Frame, ScrollableMixin):
                 "value": self._get_scalar_value(material, prop_key, cat_idx_arg),
                 "mode": "scalar",
             }
+        self._custom_row_cache[cache_key] = row
         return row
 
     def _render_table(self):
@@ -1874,23 +2142,30 @@ class SingleCalculationTab(ttk.Frame, ScrollableMixin):
             current_unit = self.column_units.get(prop_key)
 
             if not current_unit:
-                unit_type = info.get("unit_type")
-                if unit_type:
-                    avail = UnitManager.get_units(unit_type)
-                    current_unit = base_unit if base_unit in avail else UnitManager.get_system_unit(unit_type)
-                else:
-                    current_unit = base_unit
+                current_unit = UnitManager.get_default_unit(base_unit, info.get("unit_type"))
                 self.column_units[prop_key] = current_unit
 
             header_text = f"{info.get('symbol', prop_key)}\n{current_unit}"
             self.tree.heading(prop_key, text=header_text)
             self.tree.column(prop_key, width=90, minwidth=90, anchor="center", stretch=False)
 
+        # Параметры колонок вычисляются один раз на отрисовку, а не на каждую ячейку:
+        # (ключ, тип единиц, базовая ед., целевая ед., линейный множитель или None)
+        column_specs = []
+        for prop_key in visible_keys:
+            info = PROPERTIES.get_meta(prop_key)
+            unit_type, base_unit = info.get("unit_type"), info.get("unit")
+            target_unit = self.column_units.get(prop_key)
+            factor = None
+            if unit_type and base_unit and target_unit:
+                factor = UnitManager.get_linear_factor(base_unit, target_unit, unit_type)
+            column_specs.append((prop_key, unit_type, base_unit, target_unit, factor))
+
         def insert_row(row_dict, tag=""):
             values = [row_dict["temp"]]
             is_custom = (tag == "custom_calc")
 
-            for prop_key in visible_keys:
+            for prop_key, unit_type, base_unit, target_unit, factor in column_specs:
                 cell = row_dict.get(prop_key)
 
                 # Поддержка старого формата (на всякий случай)
@@ -1905,13 +2180,13 @@ class SingleCalculationTab(ttk.Frame, ScrollableMixin):
                     values.append("-")
                     continue
 
-                info = PROPERTIES.get_meta(prop_key)
-                unit_type = info.get("unit_type")
-                base_unit = info.get("unit")
-                target_unit = self.column_units.get(prop_key)
-
                 # Конвертация единиц и форматирование с точностью 0.1
-                if unit_type and base_unit and target_unit:
+                if factor is not None:
+                    try:
+                        base_str = f"{float(raw_val) * factor:.1f}"
+                    except Exception:
+                        base_str = str(raw_val)
+                elif unit_type and base_unit and target_unit:
                     try:
                         sys_val = UnitManager.to_system(raw_val, base_unit, unit_type)
                         final_val = UnitManager.from_system(sys_val, target_unit, unit_type)
@@ -2069,15 +2344,29 @@ class SingleCalculationTab(ttk.Frame, ScrollableMixin):
 class PropertyComparisonTab(ttk.Frame):
     """Вкладка 'Сравнение материалов (свойства)' с новым интерфейсом выбора."""
 
+    # При большем числе точек на графике подписи значений не выводятся (нечитаемы и дороги)
+    MAX_POINT_LABELS = 200
+
     def __init__(self, parent, app_data, main_app):
         super().__init__(parent)
         self.app_data = app_data
         self.main_app = main_app
         # listbox_item_map — текущий пул для списка поиска (фильтруется по области и свойству)
         self.listbox_item_map = {}
-        # full_item_map — полный пул "имя -> (material_data, category_data)" для всех материалов/КП,
+        # full_item_map — полный пул "имя -> (Material, category_data)" для всех материалов/КП,
         # используется для построения графика, чтобы показывать "нет данных" при смене свойства.
         self.full_item_map = {}
+        # Артисты графика, переиспользуемые между перерисовками (вместо ax.clear()):
+        # имя серии -> Line2D, подписи точек, вспомогательная сетка
+        self._lines = {}
+        self._annotations = []
+        self._minor_gridlines = []
+        # Пары (имя в нижнем регистре, имя) по отсортированным ключам listbox_item_map;
+        # пересчитываются только при смене пула, а не на каждое нажатие клавиши
+        self._sorted_keys = []
+        self._search_after_id = None
+        # Зеркало содержимого selected_listbox для проверки дублей без запроса к Tk
+        self._selected_set = set()
         self._setup_widgets()
 
     def _setup_widgets(self):
@@ -2109,7 +2398,7 @@ class PropertyComparisonTab(ttk.Frame):
         ttk.Label(controls_frame, text="Поиск материала:").pack(fill="x", pady=(5, 2))
         self.search_entry = ttk.Entry(controls_frame)
         self.search_entry.pack(fill="x", pady=(0, 5))
-        self.search_entry.bind("<KeyRelease>", self._filter_search_results)
+        self.search_entry.bind("<KeyRelease>", self._schedule_search_filter)
 
         search_list_frame = ttk.LabelFrame(controls_frame, text="Результаты поиска")
         search_list_frame.pack(fill="both", expand=True, pady=(0, 10))
@@ -2159,13 +2448,13 @@ class PropertyComparisonTab(ttk.Frame):
         for mat in self.app_data.materials:
             display_name = mat.get_display_name()
             # Сам материал (для физ. свойств)
-            self.full_item_map[display_name] = (mat.data, None)
+            self.full_item_map[display_name] = (mat, None)
 
             # Категории прочности (для мех. свойств)
             for cat in mat.get_strength_categories():
                 cat_name = Material.category_name(cat)
                 display_name_with_cat = f"{display_name} {cat_name}".strip()
-                self.full_item_map[display_name_with_cat] = (mat.data, cat)
+                self.full_item_map[display_name_with_cat] = (mat, cat)
 
         self._update_search_pool()
 
@@ -2187,6 +2476,7 @@ class PropertyComparisonTab(ttk.Frame):
           у которых для этого свойства есть непустые temperature_value_pairs.
         """
         self.listbox_item_map.clear()
+        self._sorted_keys = []
         selected_area = self.area_combo.get()
 
         # Текущее выбранное свойство
@@ -2197,16 +2487,12 @@ class PropertyComparisonTab(ttk.Frame):
             return
 
         prop_key = self.prop_keys[prop_idx]
+        is_mech = PROPERTIES.is_mechanical(prop_key)
 
-        for mat in self.app_data.materials:
-            meta = mat.data.get("metadata", {})
-            app_areas = meta.get("application_area", [])
-            if selected_area != "Все" and selected_area not in app_areas:
-                continue
-
+        for mat in materials_for_area(self.app_data, selected_area):
             display_name = mat.get_display_name()
 
-            if PROPERTIES.is_mechanical(prop_key):
+            if is_mech:
                 # Для механического свойства показываем только те категории прочности,
                 # в которых это свойство реально заполнено (есть точки).
                 cats = mat.get_strength_categories()
@@ -2233,18 +2519,26 @@ class PropertyComparisonTab(ttk.Frame):
                 # Добавляем сам материал (без разбиения по категориям)
                 self.listbox_item_map[display_name] = (mat.data, None)
 
+        self._sorted_keys = [(name.lower(), name) for name in sorted(self.listbox_item_map)]
         self._filter_search_results()
 
+    def _schedule_search_filter(self, event=None):
+        """Фильтрация при наборе текста: выполняется через 150 мс после последнего нажатия."""
+        if self._search_after_id:
+            self.after_cancel(self._search_after_id)
+        self._search_after_id = self.after(150, self._filter_search_results)
+
     def _filter_search_results(self, event=None):
         """Фильтрует список `search_listbox` на основе текста в `search_entry`."""
+        if self._search_after_id:
+            self.after_cancel(self._search_after_id)
+            self._search_after_id = None
         search_term = self.search_entry.get().lower()
         self.search_listbox.delete(0, tk.END)
 
-        sorted_keys = sorted(self.listbox_item_map.keys())
-
-        for name in sorted_keys:
-            if search_term in name.lower():
-                self.search_listbox.insert(tk.END, name)
+        matching = [name for name_lower, name in self._sorted_keys if search_term in name_lower]
+        if matching:
+            self.search_listbox.insert(tk.END, *matching)
 
     def _add_material_to_selection(self, event):
         """Добавляет материал из списка поиска в список выбранных."""
@@ -2252,9 +2546,8 @@ class PropertyComparisonTab(ttk.Frame):
         if not selected_indices: return
 
         name_to_add = self.search_listbox.get(selected_indices[0])
-        current_selected = self.selected_listbox.get(0, tk.END)
-
-        if name_to_add not in current_selected:
+        if name_to_add not in self._selected_set:
+            self._selected_set.add(name_to_add)
             self.selected_listbox.insert(tk.END, name_to_add)
 
     def _remove_material_from_selection(self, event):
@@ -2262,27 +2555,48 @@ class PropertyComparisonTab(ttk.Frame):
         selected_indices = self.selected_listbox.curselection()
         if not selected_indices: return
 
+        self._selected_set.discard(self.selected_listbox.get(selected_indices[0]))
         self.selected_listbox.delete(selected_indices[0])
 
     def _reset_selection(self):
         """Сбрасывает список выбранных материалов и график."""
+        self._selected_set.clear()
         self.selected_listbox.delete(0, tk.END)
         self.search_entry.delete(0, tk.END)
         self._filter_search_results()
         self._plot_graph()
 
+    def _remove_minor_gridlines(self):
+        for line in self._minor_gridlines:
+            line.remove()
+        self._minor_gridlines = []
+
+    def _rescale_axes(self, has_data):
+        """Пределы по текущим данным (в т.ч. после зума — кнопка Home)."""
+        # Прежние линии сетки — тоже Line2D: до relim их убираем, иначе пределы не смогут сузиться
+        self._remove_minor_gridlines()
+        if has_data:
+            self.ax.relim()
+            self.ax.autoscale(enable=True)
+        else:
+            self.ax.set_xlim(0, 1)
+            self.ax.set_ylim(0, 1)
+
     def _add_minor_gridlines(self):
-        # Эта функция остается без изменений
+        """Линии посередине между делениями; прежние линии удаляются (оси не очищаются целиком)."""
+        self._remove_minor_gridlines()
         x_ticks = self.ax.get_xticks()
         if len(x_ticks) > 1:
             for i in range(len(x_ticks) - 1):
                 mid_point = (x_ticks[i] + x_ticks[i + 1]) / 2
-                self.ax.axvline(x=mid_point, color='grey', linestyle='--', linewidth=0.5, alpha=0.7)
+                self._minor_gridlines.append(
+                    self.ax.axvline(x=mid_point, color='grey', linestyle='--', linewidth=0.5, alpha=0.7))
         y_ticks = self.ax.get_yticks()
         if len(y_ticks) > 1:
             for i in range(len(y_ticks) - 1):
                 mid_point = (y_ticks[i] + y_ticks[i + 1]) / 2
-                self.ax.axhline(y=mid_point, color='grey', linestyle='--', linewidth=0.5, alpha=0.7)
+                self._minor_gridlines.append(
+                    self.ax.axhline(y=mid_point, color='grey', linestyle='--', linewidth=0.5, alpha=0.7))
 
     def _plot_graph(self):
         """Строит график на основе списка `selected_listbox`."""
@@ -2296,22 +2610,35 @@ class PropertyComparisonTab(ttk.Frame):
         if not prop_info:
             return
 
-        self.ax.clear()
-
         selected_names = self.selected_listbox.get(0, tk.END)
         colors = ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd', '#8c564b',
                   '#e377c2', '#7f7f7f', '#bcbd22', '#17becf']
 
+        # Линии снятых с выбора серий удаляем, остальные переиспользуем через set_data
+        for name in [n for n in self._lines if n not in self._selected_set]:
+            self._lines.pop(name).remove()
+        for annotation in self._annotations:
+            annotation.remove()
+        self._annotations = []
+        has_data = False
+        plotted = []  # (temps, values) серий с данными — для подписей точек
+
         for i, display_name in enumerate(selected_names):
             color = colors[i % len(colors)]
+            line = self._lines.get(display_name)
+            if line is None:
+                line, = self.ax.plot([], [], marker='o', linestyle='-')
+                self._lines[display_name] = line
+            line.set_color(color)
 
             # Для построения графика используем ПОЛНЫЙ пул (full_item_map),
             # чтобы уже выбранные материалы/КП оставались в легенде даже если
             # для текущего свойства у них нет данных.
-            material_data, category_data = self.full_item_map.get(display_name, (None, None))
+            material, category_data = self.full_item_map.get(display_name, (None, None))
 
-            if not material_data:
+            if not material:
                 # Вообще не нашли такой материал/категорию — пропускаем
+                self._lines.pop(display_name).remove()
                 continue
 
             prop_data = None
@@ -2323,33 +2650,42 @@ class PropertyComparisonTab(ttk.Frame):
                     prop_data = Material.get_category_prop_data(category_data, prop_key)
             else:
                 # Если свойство физическое, ищем его в ОБЩИХ данных материала
-                prop_data = Material.physical_data_from_raw(material_data, prop_key)
+                prop_data = Material.physical_data_from_raw(material.data, prop_key)
 
             if prop_data and "temperature_value_pairs" in prop_data and prop_data["temperature_value_pairs"]:
-                pairs = sorted(prop_data["temperature_value_pairs"], key=lambda p: p[0])
-                temps = [p[0] for p in pairs]
-                values = [p[1] for p in pairs]
-                self.ax.plot(temps, values, marker='o', linestyle='-', label=display_name, color=color)
-                for t, v in zip(temps, values):
-                    text_label = f"{v:.0f}" if v == int(v) else f"{v:.1f}"
-                    self.ax.annotate(
-                        text_label,
-                        xy=(t, v),
-                        xytext=(5, 5),
-                        textcoords='offset points',
-                        fontsize=8,
-                        color='dimgray'
-                    )
+                # Отсортированные пары кэшируются материалом — повторная перерисовка их не сортирует
+                pairs = material.get_sorted_pairs(prop_data)
+                temps, values = zip(*pairs)
+                has_data = True
+                line.set_data(temps, values)
+                line.set_label(display_name)
+                plotted.append((temps, values))
             else:
-                # Нет данных по выбранному свойству — выводим "нет данн��х" в легенде
-                self.ax.plot([], [], marker='o', linestyle='-', label=f"{display_name} (нет данных)", color=color)
+                # Нет данных по выбранному свойству — выводим "нет данных" в легенде
+                line.set_data([], [])
+                line.set_label(f"{display_name} (нет данных)")
+
+        if sum(len(temps) for temps, _ in plotted) <= self.MAX_POINT_LABELS:
+            annotate = self.ax.annotate
+            for temps, values in plotted:
+                labels = [f"{v:.0f}" if v == int(v) else f"{v:.1f}" for v in values]
+                self._annotations.extend(
+                    annotate(text_label, xy=(t, v), xytext=(5, 5), textcoords='offset points',
+                             fontsize=8, color='dimgray')
+                    for text_label, t, v in zip(labels, temps, values)
+                )
 
         self.ax.set_xlabel("Температура [°С]")
         self.ax.set_ylabel(f"{prop_info['name']} [{prop_info['unit']}]")
         self.ax.set_title(f"Зависимость свойства '{prop_info['name']}' от температуры")
 
-        if selected_names:
-            self.ax.legend()
+        self._rescale_axes(has_data)
+
+        legend = self.ax.get_legend()
+        if legend is not None:
+            legend.remove()
+        if self._lines:
+            self.ax.legend(handles=[self._lines[n] for n in selected_names if n in self._lines])
 
         self.ax.grid(True)
         self._add_minor_gridlines()
@@ -2363,6 +2699,13 @@ class ChemComparisonTab(ttk.Frame, ScrollableMixin):
     2) Подбор материала по целевому химическому составу.
     """
 
+    # Статус подбора -> (порядок при сортировке результатов, тег строки)
+    S2_STATUS_STYLES = {
+        "Полное совпадение": (0, "full_match"),
+        "Частичное совпадение": (1, "partial_match"),
+        "Нет совпадений": (2, "no_match"),
+    }
+
     def __init__(self, parent, app_data, main_app):
         super().__init__(parent)
         self.app_data = app_data
@@ -2406,6 +2749,12 @@ class ChemComparisonTab(ttk.Frame, ScrollableMixin):
         self.s1_mat_listbox = None
         self.s1_pivot_tree = None
         self.s1_sources_tree = None
+        # Пул поиска сценария 1: пары (имя в нижнем регистре, имя) для области _s1_pool_area
+        self._s1_pool_area = None
+        self._s1_search_keys = []
+        self._s1_search_after_id = None
+        # Текущие колонки pivot-таблицы (перенастраиваются только при изменении набора)
+        self._s1_pivot_columns = ()
 
         # --- СЦЕНАРИЙ 2: Подбор по целевому составу ---
         self.s2_target_tree = None
@@ -2413,6 +2762,7 @@ class ChemComparisonTab(ttk.Frame, ScrollableMixin):
         self.s2_details_tree = None
         self.s2_area_combo = None
         self.s2_influence_frame = None     # блок "Влияние элементов..."
+        self.s2_influence_label = None     # единственная метка с текстом влияния
         self._s2_popup_window = None       # всплывающий список элементов
 
         # Кэш всех комбинаций (материал + источник состава)
@@ -2461,7 +2811,7 @@ class ChemComparisonTab(ttk.Frame, ScrollableMixin):
         ttk.Label(left_frame, text="Поиск материала:").pack(fill="x", pady=(0, 2))
         self.s1_search_entry = ttk.Entry(left_frame)
         self.s1_search_entry.pack(fill="x", pady=(0, 8))
-        self.s1_search_entry.bind("<KeyRelease>", self._s1_update_material_listbox)
+        self.s1_search_entry.bind("<KeyRelease>", self._s1_schedule_search)
 
         ttk.Label(left_frame, text="Материалы:").pack(fill="x", pady=(0, 2))
         list_frame = ttk.Frame(left_frame)
@@ -2523,8 +2873,17 @@ class ChemComparisonTab(ttk.Frame, ScrollableMixin):
         sources_frame.grid_rowconfigure(0, weight=1)
         sources_frame.grid_columnconfigure(0, weight=1)
 
+    def _s1_schedule_search(self, event=None):
+        """Фильтрация при наборе текста: выполняется через 150 мс после последнего нажатия."""
+        if self._s1_search_after_id:
+            self.after_cancel(self._s1_search_after_id)
+        self._s1_search_after_id = self.after(150, self._s1_update_material_listbox)
+
     def _s1_update_material_listbox(self, event=None):
         """Обновление списка материалов для сценария 1 (по области и поиску)."""
+        if self._s1_search_after_id:
+            self.after_cancel(self._s1_search_after_id)
+            self._s1_search_after_id = None
         if not self.s1_mat_listbox:
             return
 
@@ -2533,22 +2892,22 @@ class ChemComparisonTab(ttk.Frame, ScrollableMixin):
         selected_area = self.s1_area_combo.get() or "Все"
         search_term = (self.s1_search_entry.get() or "").lower()
 
-        for mat in self.app_data.materials:
+        # Пул пересобирается только при смене области (или после перезагрузки данных)
+        if selected_area != self._s1_pool_area:
             # учитываем только материалы с хоть одним источником хим. состава
-            if not mat.get_compositions():
-                continue
-
-            meta = mat.data.get(Schema.METADATA, {})
-            app_areas = meta.get(Schema.APP_AREA, [])
-
-            if selected_area != "Все" and selected_area not in app_areas:
-                continue
-
-            display_name = mat.get_display_name()
-            if search_term and search_term not in display_name.lower():
-                continue
+            self._s1_search_keys = [
+                (name.lower(), name)
+                for name in (
+                    mat.get_display_name()
+                    for mat in materials_for_area(self.app_data, selected_area)
+                    if mat.get_compositions()
+                )
+            ]
+            self._s1_pool_area = selected_area
 
-            self.s1_mat_listbox.insert(tk.END, display_name)
+        names = [name for name_lower, name in self._s1_search_keys if search_term in name_lower]
+        if names:
+            self.s1_mat_listbox.insert(tk.END, *names)
 
         # Автовыбор первого материала
         if self.s1_mat_listbox.size() > 0:
@@ -2564,6 +2923,7 @@ class ChemComparisonTab(ttk.Frame, ScrollableMixin):
         if self.s1_pivot_tree:
             self.s1_pivot_tree.delete(*self.s1_pivot_tree.get_children())
             self.s1_pivot_tree["columns"] = ()
+            self._s1_pivot_columns = ()
         if self.s1_sources_tree:
             self.s1_sources_tree.delete(*self.s1_sources_tree.get_children())
         self.s1_compositions = []
@@ -2580,7 +2940,7 @@ class ChemComparisonTab(ttk.Frame, ScrollableMixin):
             return
 
         name = self.s1_mat_listbox.get(selection[0])
-        material = next((m for m in self.app_data.materials if m.get_display_name() == name), None)
+        material = self.app_data.get_by_display_name(name)
         self.s1_current_material = material
         if not material:
             self._s1_clear_tables()
@@ -2653,28 +3013,31 @@ class ChemComparisonTab(ttk.Frame, ScrollableMixin):
         """
         if not elem_data:
             return "-"
+        return self._format_chem_range(
+            elem_data.get("min_value"), elem_data.get("max_value"),
+            elem_data.get("min_value_tolerance"), elem_data.get("max_value_tolerance"),
+        )
 
-        min_v, max_v = elem_data.get("min_value"), elem_data.get("max_value")
-        min_tol = elem_data.get("min_value_tolerance")
-        max_tol = elem_data.get("max_value_tolerance")
-
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _format_chem_range(min_v, max_v, min_tol, max_tol):
+        """Строка диапазона по четырём полям; у многих материалов диапазоны совпадают — кэшируется."""
         if min_v == 0:
             min_v = None
         if max_v == 0:
             max_v = None
+        if min_v is None and max_v is None:
+            return "-"
 
+        has_min_tol = min_tol not in (None, '')
+        has_max_tol = max_tol not in (None, '')
         if min_v is not None and max_v is not None:
-            min_tol_str = f"({min_tol}) " if min_tol not in (None, '') else ""
-            max_tol_str = f" ({max_tol})" if max_tol not in (None, '') else ""
+            min_tol_str = f"({min_tol}) " if has_min_tol else ""
+            max_tol_str = f" ({max_tol})" if has_max_tol else ""
             return f"{min_tol_str}{min_v} - {max_v}{max_tol_str}"
-        elif max_v is not None:
-            max_tol_str = f" ({max_tol})" if max_tol not in (None, '') else ""
-            return f"≤ {max_v}{max_tol_str}"
-        elif min_v is not None:
-            min_tol_str = f" ({min_tol})" if min_tol not in (None, '') else ""
-            return f"≥ {min_v}{min_tol_str}"
-        else:
-            return "-"
+        if max_v is not None:
+            return f"≤ {max_v} ({max_tol})" if has_max_tol else f"≤ {max_v}"
+        return f"≥ {min_v} ({min_tol})" if has_min_tol else f"≥ {min_v}"
 
     def _s1_refresh_pivot_table(self):
         """Перестраивает pivot-таблицу по элементам (строки) и источникам (столбцы)."""
@@ -2683,6 +3046,7 @@ class ChemComparisonTab(ttk.Frame, ScrollableMixin):
 
         if not self.s1_compositions or not self.s1_elements:
             tree["columns"] = ()
+            self._s1_pivot_columns = ()
             return
 
         # Базовые колонки: символ + название элемента
@@ -2691,24 +3055,32 @@ class ChemComparisonTab(ttk.Frame, ScrollableMixin):
         for idx, _ in enumerate(self.s1_compositions):
             columns.append(f"src_{idx}")
 
-        tree["columns"] = columns
+        # Колонки и их ширины задаём только при смене числа источников;
+        # иначе меняются лишь подписи источников
+        columns = tuple(columns)
+        rebuild_columns = columns != self._s1_pivot_columns
+        if rebuild_columns:
+            tree["columns"] = columns
+            self._s1_pivot_columns = columns
 
-        tree.heading("element", text="Элемент")
-        tree.column("element", width=70, anchor="center", stretch=False)
+            tree.heading("element", text="Элемент")
+            tree.column("element", width=70, anchor="center", stretch=False)
 
-        tree.heading("name", text="Название")
-        tree.column("name", width=150, anchor="w", stretch=True)
+            tree.heading("name", text="Название")
+            tree.column("name", width=150, anchor="w", stretch=True)
 
         for idx, comp in enumerate(self.s1_compositions):
             col_id = f"src_{idx}"
             header_text = comp["source_label"] or f"Источник {idx + 1}"
             tree.heading(col_id, text=header_text)
-            tree.column(col_id, width=140, anchor="center", stretch=True)
+            if rebuild_columns:
+                tree.column(col_id, width=140, anchor="center", stretch=True)
 
         # Заполнение строк
+        # Название элемента берём из ELEMENTS_MAP в ChemicalCompositionTab
+        elements_info = getattr(ChemicalCompositionTab, "ELEMENTS_MAP", {})
         for elem_sym in self.s1_elements:
-            # Название элемента берём из ELEMENTS_MAP в ChemicalCompositionTab
-            elem_info = getattr(ChemicalCompositionTab, "ELEMENTS_MAP", {}).get(elem_sym, {})
+            elem_info = elements_info.get(elem_sym, {})
             elem_name = elem_info.get("name", "")
             row_values = [elem_sym, elem_name]
 
@@ -2798,8 +3170,8 @@ class ChemComparisonTab(ttk.Frame, ScrollableMixin):
 
         def del_target_row():
             sel = self.s2_target_tree.selection()
-            for item in sel:
-                self.s2_target_tree.delete(item)
+            if sel:
+                self.s2_target_tree.delete(*sel)
             self._s2_recalculate_results()
 
         ttk.Button(btn_frame, text="+", width=2, command=add_target_row).pack(side="left", padx=2)
@@ -2927,8 +3299,17 @@ class ChemComparisonTab(ttk.Frame, ScrollableMixin):
         self.bind_mouse_wheel(influence_canvas)
         self.bind_mouse_wheel(influence_inner, influence_canvas)
 
-        # Здесь будем создавать строки с влиянием элементов
+        # Один Label на весь блок: при смене кандидата меняется только текст
         self.s2_influence_frame = influence_inner
+        self.s2_influence_label = ttk.Label(
+            influence_inner,
+            text="",
+            wraplength=700,
+            justify="left",
+            anchor="w"
+        )
+        self.s2_influence_label.pack(fill="x", anchor="w", pady=1)
+        self.bind_mouse_wheel(self.s2_influence_label, influence_canvas)
 
     # =========================================================================
     # ОБЩИЙ МЕТОД ДЛЯ ViewerFrame
@@ -2957,6 +3338,7 @@ class ChemComparisonTab(ttk.Frame, ScrollableMixin):
         self._s2_rebuild_all_compositions()
 
         # Обновляем список материалов для сценария 1
+        self._s1_pool_area = None
         self._s1_update_material_listbox()
 
         # Пересчитываем результаты подбора для сценария 2
@@ -2998,13 +3380,58 @@ class ChemComparisonTab(ttk.Frame, ScrollableMixin):
                 self.s2_all_compositions.append({
                     "material": mat,
                     "material_name": mat_name,
+                    "sort_name": mat_name.lower(),
                     "composition": comp,
                     "source_label": source_label,
                     "base_element": base_element,
                     "unit": unit,
-                    "elements_map": elements_map
+                    "elements_map": elements_map,
+                    # Разобранные границы элементов — чтобы подбор не парсил строки на каждый пересчёт
+                    "bounds": {sym: self._s2_element_bounds(e) for sym, e in elements_map.items()}
                 })
 
+    @staticmethod
+    def _s2_element_bounds(elem_info):
+        """
+        Границы элемента состава: (min, max, min_tol, max_tol, lower, upper).
+        lower/upper — эффективные пределы с учётом допусков; оба None,
+        если у элемента нет ни Min, ни Max.
+        """
+        # Базовые границы
+        min_v = safe_float(elem_info.get("min_value"))
+        max_v = safe_float(elem_info.get("max_value"))
+        # Допуски (абсолютные значения)
+        min_tol = safe_float(elem_info.get("min_value_tolerance"))
+        max_tol = safe_float(elem_info.get("max_value_tolerance"))
+
+        # Если и Min, и Max отсутствуют — трактуем как отсутствие данных по элементу
+        if min_v is None and max_v is None:
+            return min_v, max_v, min_tol, max_tol, None, None
+
+        # Эффективные границы с учётом допусков (НОВАЯ ЛОГИКА):
+        # - если заданы и min, и min_tol -> нижняя граница = min_tol (абсолютный предел);
+        # - если задан только один из них -> нижняя граница = это значение;
+        # - если нет ни min, ни min_tol -> нижняя граница = -inf.
+        if min_tol is not None:
+            lower = min_tol
+        elif min_v is not None:
+            lower = min_v
+        else:
+            lower = float("-inf")
+
+        # Аналогично для верхней границы:
+        # - если заданы и max, и max_tol -> верхняя граница = max_tol (абсолютный предел);
+        # - если задан только один из них -> верхняя граница = это значение;
+        # - если нет ни max, ни max_tol -> верхняя граница = +inf.
+        if max_tol is not None:
+            upper = max_tol
+        elif max_v is not None:
+            upper = max_v
+        else:
+            upper = float("inf")
+
+        return min_v, max_v, min_tol, max_tol, lower, upper
+
     def _s2_collect_targets(self):
         """
         Собирает целевые значения из таблицы слева.
@@ -3015,11 +3442,11 @@ class ChemComparisonTab(ttk.Frame, ScrollableMixin):
             return targets
 
         for item_id in self.s2_target_tree.get_children():
-            values = self.s2_target_tree.set(item_id)
-            elem = (values.get("elem") or "").strip()
+            elem, val_str = self.s2_target_tree.item(item_id, "values")[:2]
+            elem = str(elem).strip()
             if not elem:
                 continue
-            val_str = (values.get("target") or "").strip()
+            val_str = str(val_str).strip()
             if not val_str:
                 continue
             t_val = safe_float(val_str)
@@ -3047,33 +3474,27 @@ class ChemComparisonTab(ttk.Frame, ScrollableMixin):
             return
 
         selected_area = self.s2_area_combo.get() or "Все"
+        # Материалы области — один раз из индекса, а не разбор metadata каждого кандидата
+        area_materials = None
+        if selected_area != "Все":
+            area_materials = set(materials_for_area(self.app_data, selected_area))
 
         candidates = []
 
         for cand in self.s2_all_compositions:
-            mat = cand["material"]
-            meta = mat.data.get(Schema.METADATA, {})
-            app_areas = meta.get(Schema.APP_AREA, [])
-
-            if selected_area != "Все" and selected_area not in app_areas:
+            if area_materials is not None and cand["material"] not in area_materials:
                 continue
 
             evaluated = self._s2_evaluate_candidate(cand, targets)
             if evaluated:
                 candidates.append(evaluated)
 
-        # Сортировка: сначала полные совпадения, затем частичные, затем без совпадений
-        def sort_key(c):
-            if c["status"] == "Полное совпадение":
-                rank = 0
-            elif c["status"] == "Частичное совпадение":
-                rank = 1
-            else:
-                rank = 2
-            # Чем больше совпавших и меньше max_delta – тем выше
-            return (rank, -c["matched"], c["max_delta"], c["missing"], c["material_name"].lower())
-
-        candidates.sort(key=sort_key)
+        # Сортировка: сначала полные совпадения, затем частичные, затем без совпадений;
+        # чем больше совпавших и меньше max_delta – тем выше
+        styles = self.S2_STATUS_STYLES
+        candidates.sort(key=lambda c: (
+            styles[c["status"]][0], -c["matched"], c["max_delta"], c["missing"], c["sort_name"]
+        ))
 
         for c in candidates:
             item_values = (
@@ -3084,12 +3505,7 @@ class ChemComparisonTab(ttk.Frame, ScrollableMixin):
                 str(c["total_targets"]),
                 c["status"]
             )
-            if c["status"] == "Полное совпадение":
-                tag = "full_match"
-            elif c["status"] == "Частичное совпадение":
-                tag = "partial_match"
-            else:
-                tag = "no_match"
+            tag = styles[c["status"]][1]
 
             item_id = self.s2_results_tree.insert("", "end", values=item_values, tags=(tag,))
             self.s2_candidate_by_item[item_id] = c
@@ -3104,98 +3520,43 @@ class ChemComparisonTab(ttk.Frame, ScrollableMixin):
         """
         Оценивает один источник состава относительно целевого набора элементов.
         Учитывает допуски Min/Max (min_value_tolerance, max_value_tolerance).
-        Возвращает dict с суммарными метриками и деталями по каждому элементу.
+        Возвращает dict с суммарными метриками и состоянием по каждому элементу:
+        states = {элемент: (state, delta)}; цель и границы для таблицы деталей
+        берутся из targets/bounds только при показе выбранного кандидата.
         """
-        elements_map = cand["elements_map"]
-        details = {}
+        bounds_map = cand["bounds"]
+        states = {}
         matched = 0
         missing = 0
         numeric_deltas = []
 
         for elem_sym, target_val in targets.items():
-            elem_info = elements_map.get(elem_sym)
-            detail = {
-                "target": target_val,
-                "min": None,
-                "max": None,
-                "min_tol": None,
-                "max_tol": None,
-                "state": "",
-                "delta": None
-            }
+            bounds = bounds_map.get(elem_sym)
 
-            # Элемента вообще нет в составе
-            if not elem_info:
-                detail["state"] = "missing"
+            # Элемента нет в составе, либо у него нет ни Min, ни Max
+            if bounds is None or bounds[4] is None:
+                states[elem_sym] = ("missing", None)
                 missing += 1
-                details[elem_sym] = detail
                 continue
 
-            # Базовые границы
-            min_v = safe_float(elem_info.get("min_value"))
-            max_v = safe_float(elem_info.get("max_value"))
-            # Допуски (абсолютные значения)
-            min_tol = safe_float(elem_info.get("min_value_tolerance"))
-            max_tol = safe_float(elem_info.get("max_value_tolerance"))
-
-            detail["min"] = min_v
-            detail["max"] = max_v
-            detail["min_tol"] = min_tol
-            detail["max_tol"] = max_tol
-
-            # Если и Min, и Max отсутствуют — трактуем как отсутствие данных по элементу
-            if min_v is None and max_v is None:
-                detail["state"] = "missing"
-                missing += 1
-                details[elem_sym] = detail
-                continue
-
-            # Эффективные границы с учётом допусков (НОВАЯ ЛОГИКА):
-            # - если заданы и min, и min_tol -> нижняя граница = min_tol (абсолютный предел);
-            # - если задан только один из них -> нижняя граница = это значение;
-            # - если нет ни min, ни min_tol -> нижняя граница = -inf.
-            if min_v is not None and min_tol is not None:
-                lower = min_tol
-            elif min_v is not None:
-                lower = min_v
-            elif min_tol is not None:
-                lower = min_tol
-            else:
-                lower = float("-inf")
-
-            # Аналогично для верхней границы:
-            # - если заданы и max, и max_tol -> верхняя граница = max_tol (абсолютный предел);
-            # - если задан только один из них -> верхняя граница = это значение;
-            # - если нет ни max, ни max_tol -> верхняя граница = +inf.
-            if max_v is not None and max_tol is not None:
-                upper = max_tol
-            elif max_v is not None:
-                upper = max_v
-            elif max_tol is not None:
-                upper = max_tol
-            else:
-                upper = float("inf")
-
+            lower, upper = bounds[4], bounds[5]
             if lower <= target_val <= upper:
-                detail["state"] = "in"
+                states[elem_sym] = ("in", None)
                 matched += 1
+            elif target_val < lower:
+                delta = None
+                if lower != float("-inf"):
+                    delta = lower - target_val
+                    numeric_deltas.append(delta)
+                states[elem_sym] = ("below", delta)
+            elif target_val > upper:
+                delta = None
+                if upper != float("inf"):
+                    delta = target_val - upper
+                    numeric_deltas.append(delta)
+                states[elem_sym] = ("above", delta)
             else:
-                if target_val < lower:
-                    detail["state"] = "below"
-                    if lower != float("-inf"):
-                        delta = lower - target_val
-                        detail["delta"] = delta
-                        numeric_deltas.append(delta)
-                elif target_val > upper:
-                    detail["state"] = "above"
-                    if upper != float("inf"):
-                        delta = target_val - upper
-                        detail["delta"] = delta
-                        numeric_deltas.append(delta)
-                else:
-                    detail["state"] = "missing"
-
-            details[elem_sym] = detail
+                states[elem_sym] = ("missing", None)
 
         total_targets = len(targets)
 
@@ -3211,10 +3572,13 @@ class ChemComparisonTab(ttk.Frame, ScrollableMixin):
         return {
             "material": cand["material"],
             "material_name": cand["material_name"],
+            "sort_name": cand["sort_name"],
             "source_label": cand["source_label"],
             "base_element": cand["base_element"],
             "unit": cand["unit"],
-            "details": details,
+            "targets": targets,
+            "bounds": bounds_map,
+            "states": states,
             "matched": matched,
             "total_targets": total_targets,
             "missing": missing,
@@ -3265,15 +3629,11 @@ class ChemComparisonTab(ttk.Frame, ScrollableMixin):
             "": "нет данных"
         }
 
-        for elem_sym in sorted(cand["details"].keys()):
-            d = cand["details"][elem_sym]
-            target = d["target"]
-            min_v = d["min"]
-            max_v = d["max"]
-            min_tol = d.get("min_tol")
-            max_tol = d.get("max_tol")
-            state = d["state"]
-            delta = d["delta"]
+        no_bounds = (None, None, None, None)
+        for elem_sym in sorted(cand["states"]):
+            state, delta = cand["states"][elem_sym]
+            target = cand["targets"][elem_sym]
+            min_v, max_v, min_tol, max_tol = (cand["bounds"].get(elem_sym) or no_bounds)[:4]
 
             def fmt(x, prec=4):
                 if x is None:
@@ -3310,21 +3670,19 @@ class ChemComparisonTab(ttk.Frame, ScrollableMixin):
 
     def _s2_clear_influence(self):
         """Очищает блок 'Влияние элементов на свойства стали'."""
-        if not self.s2_influence_frame:
+        if not self.s2_influence_label:
             return
-        for w in self.s2_influence_frame.winfo_children():
-            w.destroy()
+        self.s2_influence_label.configure(text="")
 
     def _s2_update_influence(self, cand):
         """Заполняет блок влияния элементов на свойства стали по выбранному кандидату."""
-        if not self.s2_influence_frame:
+        if not self.s2_influence_label:
             return
 
-        self._s2_clear_influence()
-
         elements_map = getattr(ChemicalCompositionTab, "ELEMENTS_MAP", {})
+        blocks = []
 
-        for elem_sym in sorted(cand["details"].keys()):
+        for elem_sym in sorted(cand["states"]):
             tip = self.element_tooltips.get(elem_sym)
             elem_info = elements_map.get(elem_sym, {})
             elem_name = elem_info.get("name", elem_sym)
@@ -3353,16 +3711,9 @@ class ChemComparisonTab(ttk.Frame, ScrollableMixin):
             if reduces_line:
                 lines_to_show.append(reduces_line)
 
-            text = "\n".join(lines_to_show)
+            blocks.append("\n".join(lines_to_show))
 
-            lbl = ttk.Label(
-                self.s2_influence_frame,
-                text=text,
-                wraplength=700,
-                justify="left",
-                anchor="w"
-            )
-            lbl.pack(fill="x", anchor="w", pady=1)
+        self.s2_influence_label.configure(text="\n".join(blocks))
 
     def _s2_on_target_right_click(self, event):
         """ПКМ по ячейке 'Элемент' в таблице целевого состава — выбор элемента из списка."""
@@ -3415,12 +3766,9 @@ class ChemComparisonTab(ttk.Frame, ScrollableMixin):
         elements_map = getattr(ChemicalCompositionTab, "ELEMENTS_MAP", {})
         sorted_items = sorted(elements_map.items(), key=lambda x: x[1].get("name", ""))
 
-        items_data = []
-        for symbol, data in sorted_items:
-            name = data.get("name", symbol)
-            display_text = f"{name} ({symbol})"
-            listbox.insert(tk.END, display_text)
-            items_data.append((symbol, name))
+        items_data = [(symbol, data.get("name", symbol)) for symbol, data in sorted_items]
+        if items_data:
+            listbox.insert(tk.END, *(f"{name} ({symbol})" for symbol, name in items_data))
 
         def on_select(evt):
             sel_idx = listbox.curselection()
@@ -3474,9 +3822,21 @@ class AshbyDiagramTab(ttk.Frame):
             f"{info['name']} ({info.get('symbol', '')})"
             for info in self.ashby_properties_map.values()
         ]
+        # Имя оси -> индекс; имя оси -> список остальных имён (values соседнего комбобокса)
+        self._ashby_index_by_name = {name: i for i, name in enumerate(self.ashby_prop_names)}
+        self._axis_values_excluding = {
+            name: tuple(other for other in self.ashby_prop_names if other != name)
+            for name in self.ashby_prop_names
+        }
+        # Оси (X, Y), по которым диаграмма построена последний раз
+        self._plotted_axes = None
 
         # Пул классов для текущей области (для поиска)
         self.class_search_pool = []
+        self._class_search_keys = []  # (класс в нижнем регистре, класс) для поиска
+        self._search_after_id = None
+        # Зеркало содержимого selected_listbox для проверки дублей без запроса к Tk
+        self._selected_set = set()
 
         self._setup_widgets()
 
@@ -3510,7 +3870,7 @@ class AshbyDiagramTab(ttk.Frame):
         ttk.Label(controls_frame, text="Поиск структурного класса:").pack(fill="x", pady=(5, 2))
         self.search_entry = ttk.Entry(controls_frame)
         self.search_entry.pack(fill="x", pady=(0, 5))
-        self.search_entry.bind("<KeyRelease>", self._filter_search_results)
+        self.search_entry.bind("<KeyRelease>", self._schedule_search_filter)
 
         # Список результатов поиска классов
         search_list_frame = ttk.LabelFrame(controls_frame, text="Результаты поиска")
@@ -3585,26 +3945,33 @@ class AshbyDiagramTab(ttk.Frame):
             selected_area = "Все"
 
         classes = set()
-        for mat in self.app_data.materials:
+        for mat in materials_for_area(self.app_data, selected_area):
             meta = mat.data.get(Schema.METADATA, {})
-            app_areas = meta.get(Schema.APP_AREA, [])
-            if selected_area != "Все" and selected_area not in app_areas:
-                continue
             cls = meta.get("classification", {}).get("classification_class", "")
             if cls:
                 classes.add(cls)
 
         self.class_search_pool = sorted(classes)
+        self._class_search_keys = [(cls_name.lower(), cls_name) for cls_name in self.class_search_pool]
         self._filter_search_results()
 
+    def _schedule_search_filter(self, event=None):
+        """Фильтрация при наборе текста: выполняется через 150 мс после последнего нажатия."""
+        if self._search_after_id:
+            self.after_cancel(self._search_after_id)
+        self._search_after_id = self.after(150, self._filter_search_results)
+
     def _filter_search_results(self, event=None):
         """Фильтрация списка классов по тексту поиска."""
+        if self._search_after_id:
+            self.after_cancel(self._search_after_id)
+            self._search_after_id = None
         search_term = self.search_entry.get().lower()
         self.search_listbox.delete(0, tk.END)
 
-        for cls_name in self.class_search_pool:
-            if search_term in cls_name.lower():
-                self.search_listbox.insert(tk.END, cls_name)
+        matching = [cls_name for cls_lower, cls_name in self._class_search_keys if search_term in cls_lower]
+        if matching:
+            self.search_listbox.insert(tk.END, *matching)
 
     def _add_material_to_selection(self, event):
         """Добавляет класс из результатов поиска в список выбранных классов."""
@@ -3613,9 +3980,8 @@ class AshbyDiagramTab(ttk.Frame):
             return
 
         class_name = self.search_listbox.get(selected_indices[0])
-        current_selected = self.selected_listbox.get(0, tk.END)
-
-        if class_name not in current_selected:
+        if class_name not in self._selected_set:
+            self._selected_set.add(class_name)
             self.selected_listbox.insert(tk.END, class_name)
 
     def _remove_material_from_selection(self, event):
@@ -3624,10 +3990,12 @@ class AshbyDiagramTab(ttk.Frame):
         if not selected_indices:
             return
 
+        self._selected_set.discard(self.selected_listbox.get(selected_indices[0]))
         self.selected_listbox.delete(selected_indices[0])
 
     def _reset_selection(self):
         """Сбрасывает выбранные классы и перерисовывает диаграмму."""
+        self._selected_set.clear()
         self.selected_listbox.delete(0, tk.END)
         self._plot_diagram()
 
@@ -3641,39 +4009,63 @@ class AshbyDiagramTab(ttk.Frame):
         x_selection = self.x_axis_combo.get()
         y_selection = self.y_axis_combo.get()
 
-        if x_selection:
-            self.y_axis_combo['values'] = [name for name in self.ashby_prop_names if name != x_selection]
-        else:
-            self.y_axis_combo['values'] = self.ashby_prop_names
-
-        if y_selection:
-            self.x_axis_combo['values'] = [name for name in self.ashby_prop_names if name != y_selection]
-        else:
-            self.x_axis_combo['values'] = self.ashby_prop_names
+        all_names = self.ashby_prop_names
+        y_values = self._axis_values_excluding.get(x_selection, all_names)
+        x_values = self._axis_values_excluding.get(y_selection, all_names)
+        self.y_axis_combo['values'] = y_values
+        self.x_axis_combo['values'] = x_values
 
         # Восстанавливаем текущее значение после обновления values
-        if x_selection and x_selection in self.x_axis_combo['values']:
+        if x_selection and x_selection in x_values:
             self.x_axis_combo.set(x_selection)
-        if y_selection and y_selection in self.y_axis_combo['values']:
+        if y_selection and y_selection in y_values:
             self.y_axis_combo.set(y_selection)
 
+        # Повторный выбор того же пункта не меняет диаграмму — не перерисовываем
+        if (x_selection, y_selection) == self._plotted_axes:
+            return
         self._plot_diagram()
 
     # === Вспомогательные функции для расчета точек ===
 
-    def _get_axis_value(self, material, cat_idx, prop_key, temp):
-        """Возвращает значение свойства для оси при заданной температуре."""
+    def _get_axis_sources(self, material, cat_idx, prop_key):
+        """
+        Источники данных свойства для оси в порядке поиска get_interpolated_property:
+        список (xs, отсортированные пары); None — ось температуры.
+        Разбираются один раз на серию, а не на каждую температуру.
+        """
         if prop_key == "temperature":
-            return temp
+            return None
 
         if PROPERTIES.is_physical(prop_key):
-            return material.get_interpolated_property(prop_key, temp)
+            category_idx = None
+        elif PROPERTIES.is_mechanical(prop_key) and cat_idx is not None:
+            category_idx = cat_idx
+        else:
+            return []
 
-        if PROPERTIES.is_mechanical(prop_key):
-            if cat_idx is None:
-                return None
-            return material.get_interpolated_property(prop_key, temp, category_idx=cat_idx)
+        cats = material.get_strength_categories()
+        if category_idx is not None and 0 <= category_idx < len(cats):
+            cats = [cats[category_idx]]
+        datas = [material.get_physical_data(prop_key)]
+        datas.extend(Material.get_category_prop_data(cat, prop_key) for cat in cats)
 
+        sources = []
+        for data in datas:
+            if data:
+                pairs = material.get_sorted_pairs(data)
+                sources.append(([p[0] for p in pairs], pairs))
+        return sources
+
+    @staticmethod
+    def _axis_value_at(sources, temp):
+        """Значение оси при температуре temp по источникам из _get_axis_sources."""
+        if sources is None:
+            return temp
+        for xs, pairs in sources:
+            val = MathUtils.interpolate_sorted(xs, pairs, temp)
+            if val is not None:
+                return val
         return None
 
     def _compute_series_points(self, material, cat_idx, x_prop_key, y_prop_key):
@@ -3693,29 +4085,25 @@ class AshbyDiagramTab(ttk.Frame):
 
             if PROPERTIES.is_physical(prop_key):
                 prop_data = material.get_physical_data(prop_key) or {}
-                for t_raw, _ in prop_data.get(Schema.TEMP_PAIRS, []):
-                    t_val = MathUtils.safe_float(t_raw)
-                    if t_val is not None:
-                        temps.add(t_val)
+                temps.update(t for t, _ in material.get_numeric_points(prop_data))
 
             elif PROPERTIES.is_mechanical(prop_key) and cat_idx is not None:
                 cats = material.get_strength_categories()
                 if 0 <= cat_idx < len(cats):
                     prop_data = Material.get_category_prop_data(cats[cat_idx], prop_key) or {}
-                    for t_raw, _ in prop_data.get(Schema.TEMP_PAIRS, []):
-                        t_val = MathUtils.safe_float(t_raw)
-                        if t_val is not None:
-                            temps.add(t_val)
+                    temps.update(t for t, _ in material.get_numeric_points(prop_data))
 
         if not temps:
             return [], []
 
         temps = sorted(temps)
         xs, ys = [], []
+        x_sources = self._get_axis_sources(material, cat_idx, x_prop_key)
+        y_sources = self._get_axis_sources(material, cat_idx, y_prop_key)
 
         for t in temps:
-            x_val = self._get_axis_value(material, cat_idx, x_prop_key, t)
-            y_val = self._get_axis_value(material, cat_idx, y_prop_key, t)
+            x_val = self._axis_value_at(x_sources, t)
+            y_val = self._axis_value_at(y_sources, t)
             if x_val is not None and y_val is not None:
                 xs.append(x_val)
                 ys.append(y_val)
@@ -3774,11 +4162,11 @@ class AshbyDiagramTab(ttk.Frame):
         if not x_selection_text or not y_selection_text:
             return
 
-        try:
-            x_prop_index = self.ashby_prop_names.index(x_selection_text)
-            y_prop_index = self.ashby_prop_names.index(y_selection_text)
-        except ValueError:
+        x_prop_index = self._ashby_index_by_name.get(x_selection_text)
+        y_prop_index = self._ashby_index_by_name.get(y_selection_text)
+        if x_prop_index is None or y_prop_index is None:
             return
+        self._plotted_axes = (x_selection_text, y_selection_text)
 
         x_prop_key = self.ashby_prop_keys[x_prop_index]
         y_prop_key = self.ashby_prop_keys[y_prop_index]
@@ -3804,20 +4192,24 @@ class AshbyDiagramTab(ttk.Frame):
         x_is_mech = PROPERTIES.is_mechanical(x_prop_key)
         y_is_mech = PROPERTIES.is_mechanical(y_prop_key)
 
+        # Раскладываем материалы области по выбранным классам за один проход
+        selected_set = set(selected_classes)
+        materials_by_class = {}
+        for mat in materials_for_area(self.app_data, selected_area):
+            meta = mat.data.get(Schema.METADATA, {})
+            cls = meta.get("classification", {}).get("classification_class", "")
+            if cls in selected_set:
+                materials_by_class.setdefault(cls, []).append(mat)
+
+        # Оболочки классов собираются и добавляются на оси одной коллекцией
+        hull_polygons = []
+        hull_colors = []
+
         for idx_class, class_name in enumerate(selected_classes):
             class_color = class_colors[idx_class % len(class_colors)]
             class_points = []  # Для выпуклой оболочки по этому классу
 
-            for mat in self.app_data.materials:
-                meta = mat.data.get(Schema.METADATA, {})
-                app_areas = meta.get(Schema.APP_AREA, [])
-                cls = meta.get("classification", {}).get("classification_class", "")
-
-                if cls != class_name:
-                    continue
-                if selected_area != "Все" and selected_area not in app_areas:
-                    continue
-
+            for mat in materials_by_class.get(class_name, ()):
                 cats = mat.get_strength_categories()
 
                 # Если хотя бы одна ось механическая — рисуем по категориям
@@ -3866,10 +4258,16 @@ class AshbyDiagramTab(ttk.Frame):
             if len(class_points) >= 3:
                 hull = self._compute_convex_hull(class_points)
                 if len(hull) >= 3:
-                    hx = [p[0] for p in hull] + [hull[0][0]]
-                    hy = [p[1] for p in hull] + [hull[0][1]]
+                    hull_polygons.append(hull)
                     # Для области оставляем цвет класса (class_color)
-                    self.ax.fill(hx, hy, color=class_color, alpha=0.15, zorder=0)
+                    hull_colors.append(class_color)
+
+        if hull_polygons:
+            # Точки оболочек уже нанесены линиями серий — пределы осей коллекция не меняет
+            self.ax.add_collection(PolyCollection(
+                hull_polygons, facecolors=hull_colors, edgecolors=hull_colors,
+                alpha=0.15, zorder=0
+            ), autolim=False)
 
         self.ax.set_xlabel(f"{x_prop_info['name']} [{x_prop_info['unit']}]")
         self.ax.set_ylabel(f"{y_prop_info['name']} [{y_prop_info['unit']}]")
@@ -3912,16 +4310,37 @@ class AshbyDiagramTab(ttk.Frame):
 # ======================================================================================
 
 
+@contextmanager
+def deferred_redraws(editors):
+    """
+    Откладывает отрисовку графиков SinglePropertyEditor на время массового заполнения формы.
+    На выходе каждый изменённый график перерисовывается один раз.
+    """
+    editors = list(editors)
+    for editor in editors:
+        editor._defer_draw = True
+    try:
+        yield
+    finally:
+        for editor in editors:
+            editor._defer_draw = False
+            if editor._draw_pending:
+                editor._draw_pending = False
+                editor._render(idle=True)
+
+
 class SinglePropertyEditor(ttk.Frame):
     """
     Переиспользуемый компонент для редактирования одного свойства.
     Содержит: Поля (Ед. изм, Источник свойств, Комментарий), Таблицу точек и График.
     """
 
-    def __init__(self, parent, prop_key, prop_info):
+    def __init__(self, parent, prop_key, prop_info, on_change=None):
         super().__init__(parent)
         self.prop_key = prop_key
         self.prop_info = prop_info
+        # Вызывается после правки ячейки таблицы (inline-редактор не несёт bindtags вкладки)
+        self.on_change = on_change
         self._temperature_dependent = PROPERTIES.supports_temperature(prop_key)
 
         # Менеджер источников и кэш отображения
@@ -3935,6 +4354,21 @@ class SinglePropertyEditor(ttk.Frame):
         self.canvas = None
         self.tree = None
         self.scalar_value_entry = None
+        # Отсортированные точки графика и разобранное значение каждой строки таблицы
+        self._sorted_points = []
+        self._row_points = {}  # item_id -> (t, v) | None
+        # Отложенная отрисовка (см. deferred_redraws)
+        self._defer_draw = False
+        self._draw_pending = False
+        # Превью (PNG) уже запланировано на after_idle — серия правок даёт одну отрисовку
+        self._preview_pending = False
+        # Превью не рисовалось, пока панель графика скрыта (неактивная вкладка) — дорисуем при показе
+        self._preview_stale = False
+        # Ключ последней раскладки tight_layout: (единица, ширина подписей пределов Y)
+        self._layout_key = None
+        # Фон холста без линии (для blit) и пределы/раскладка, при которых он снят
+        self._background = None
+        self._background_key = None
 
         self._setup_layout()
 
@@ -3996,8 +4430,8 @@ class SinglePropertyEditor(ttk.Frame):
         if self.prop_info["unit"] in units:
             self.unit_combo.set(self.prop_info["unit"])
 
-        # При смене единицы обновляем график
-        self.unit_combo.bind("<<ComboboxSelected>>", lambda e: self.update_graph())
+        # При смене единицы точки не меняются — перерисовываем график по кэшу
+        self.unit_combo.bind("<<ComboboxSelected>>", lambda e: self._redraw_cached())
 
         # 2. Источник свойств (вместо Под-источника)
         ttk.Label(left_panel, text="Источник свойств:").grid(row=1, column=0, sticky="w", pady=2)
@@ -4026,7 +4460,7 @@ class SinglePropertyEditor(ttk.Frame):
         table_frame.grid(row=3, column=0, columnspan=2, sticky="nsew", pady=5)
         left_panel.rowconfigure(3, weight=1)
 
-        self.tree = create_editable_treeview(table_frame, on_update_callback=self.update_graph)
+        self.tree = create_editable_treeview(table_frame, on_item_update=self._on_tree_edit)
 
         self.tree.configure(show="headings")
         self.tree["columns"] = ("temp", "value")
@@ -4042,43 +4476,201 @@ class SinglePropertyEditor(ttk.Frame):
         # Кнопки +/-
         btn_frame = ttk.Frame(table_frame)
         btn_frame.pack(side="left", fill="y", padx=5)
-        ttk.Button(btn_frame, text="+", width=2,
-                   command=lambda: (self.tree.insert("", "end", values=["0", "0"]), self.update_graph())).pack(pady=2)
+        ttk.Button(btn_frame, text="+", width=2, command=self._add_row).pack(pady=2)
         ttk.Button(btn_frame, text="-", width=2,
-                   command=lambda: (self.tree.delete(self.tree.selection()), self.update_graph())).pack(pady=2)
+                   command=self._delete_selected_rows).pack(pady=2)
 
         # --- ПРАВАЯ ПАНЕЛЬ (ГРАФИК) ---
+        # До первого фокуса в полях свойства график — статичная картинка (Agg → PPM),
+        # FigureCanvasTkAgg создаётся лениво в _activate_canvas
         self.fig = Figure(figsize=(4, 3), dpi=90)
+        FigureCanvasAgg(self.fig)
         self.ax = self.fig.add_subplot(111)
-        self.canvas = FigureCanvasTkAgg(self.fig, master=right_panel)
-        self.canvas.get_tk_widget().pack(fill="both", expand=True)
+        # Линия и оформление создаются один раз; при правках меняются только данные линии
+        self._line, = self.ax.plot([], [], 'o-', markersize=4)
+        self.ax.set_xlabel("T, °C", fontsize=8)
+        self.ax.grid(True, linestyle='--', alpha=0.6)
+        self.ax.tick_params(labelsize=8)
+        self._right_panel = right_panel
+        self._preview_image = None
+        self.preview_label = ttk.Label(right_panel)
+        self.preview_label.pack(fill="both", expand=True)
+        # Скрытая вкладка снимает с экрана только свою панель, а не вложенные виджеты:
+        # <Map> самой панели графика при возврате на вкладку не придёт, поэтому
+        # дорисовку вешаем и на страницы всех вкладок-предков
+        widget = right_panel
+        while widget is not None:
+            if widget is right_panel or isinstance(widget.master, ttk.Notebook):
+                widget.bind("<Map>", self._on_graph_panel_map, add="+")
+            widget = widget.master
+        for widget in (self.unit_combo, self.source_combo, self.comment_entry, self.tree):
+            widget.bind("<FocusIn>", self._activate_canvas, add="+")
+
+    def _activate_canvas(self, event=None):
+        """Заменяет статичное превью интерактивным холстом Matplotlib."""
+        if self.canvas is not None:
+            return
+        self.preview_label.pack_forget()
+        self.canvas = FigureCanvasTkAgg(self.fig, master=self._right_panel)
+        widget = self.canvas.get_tk_widget()
+        # Холст создаётся после bind_all_children — переносим с превью тег прокрутки колесом
+        wheel_tags = tuple(t for t in self.preview_label.bindtags() if t.startswith("WheelScroll"))
+        tags = widget.bindtags()
+        widget.bindtags(tags[:1] + wheel_tags + tags[1:])
+        widget.pack(fill="both", expand=True)
+        # Линия рисуется поверх сохранённого фона (оси, сетка, подписи), а не полной перерисовкой
+        self._line.set_animated(True)
+        self.canvas.mpl_connect("draw_event", self._on_canvas_draw)
+        self.canvas.draw()
+
+    def _graph_view_key(self):
+        return self.ax.get_xlim(), self.ax.get_ylim(), self._layout_key
+
+    def _on_canvas_draw(self, event):
+        self._background = self.canvas.copy_from_bbox(self.fig.bbox)
+        self._background_key = self._graph_view_key()
+        self.ax.draw_artist(self._line)
+
+    def _render(self, idle=False):
+        if self.canvas is not None:
+            if self._background is not None and self._background_key == self._graph_view_key():
+                # Пределы и раскладка не менялись — восстанавливаем фон и блитим только линию
+                self.canvas.restore_region(self._background)
+                self.ax.draw_artist(self._line)
+                self.canvas.blit(self.fig.bbox)
+            elif idle:
+                self.canvas.draw_idle()
+            else:
+                self.canvas.draw()
+            return
+        if idle:
+            if not self._preview_pending:
+                self._preview_pending = True
+                self.after_idle(self._render_preview)
+            return
+        self._render_preview()
+
+    def _render_preview(self):
+        """Статичное превью графика (Agg → PPM) до активации интерактивного холста."""
+        self._preview_pending = False
+        if self.canvas is not None:
+            return
+        if not self._right_panel.winfo_viewable():
+            self._preview_stale = True
+            return
+        self._preview_stale = False
+        # Буфер Agg передаётся в Tk как несжатый PPM: без PNG-сжатия, base64 и обратного декодирования
+        rgba, (width, height) = self.fig.canvas.print_to_buffer()
+        rgb = bytearray(width * height * 3)
+        for channel in range(3):
+            rgb[channel::3] = rgba[channel::4]
+        self._preview_image = tk.PhotoImage(
+            data=b"P6 %d %d 255\n" % (width, height) + bytes(rgb), format="PPM")
+        self.preview_label.configure(image=self._preview_image)
+
+    def _on_graph_panel_map(self, event=None):
+        # Привязка на странице вкладки переживает редактор — проверяем, что он ещё существует
+        if self._preview_stale and self.winfo_exists():
+            self._render_preview()
+
+    def _add_row(self):
+        # Строка по умолчанию (0, 0) попадает в кэш точек, но не перерисовывает график —
+        # это сделает правка ячейки
+        item = self.tree.insert("", "end", values=["0", "0"])
+        point = self._row_points[item] = self._parse_point("0", "0")
+        bisect.insort(self._sorted_points, point)
+
+    def _redraw_cached(self):
+        if self.ax:
+            self._draw_points()
+
+    def _delete_selected_rows(self):
+        """Удаляет все выделенные строки одним вызовом и перерисовывает график один раз."""
+        selected = self.tree.selection()
+        if not selected:
+            return
+        self.tree.delete(*selected)
+        # Из кэша убираем только точки удалённых строк, остальные не перечитываем
+        for item in selected:
+            self._drop_point(self._row_points.pop(item, None))
+        self._redraw_cached()
+
+    def _on_tree_edit(self, item):
+        if self.ax:
+            self._update_edited_point(item)
+            self._draw_points()
+        if self.on_change:
+            self.on_change()
+
+    def _parse_row(self, item):
+        # item(..., "values") — один вызов Tcl и кортеж, без сборки словаря колонок
+        t, v = self.tree.item(item, "values")[:2]
+        return self._parse_point(t, v)
+
+    @staticmethod
+    def _parse_point(t, v):
+        t_val = safe_float(t)
+        v_val = safe_float(v)
+        if t_val is None or v_val is None:
+            return None
+        return t_val, v_val
+
+    def _update_edited_point(self, item):
+        """Правка одной строки: точка переставляется бинарным поиском, без полной пересортировки."""
+        if not item or not self.tree.exists(item):
+            return
+        old = self._row_points.get(item)
+        new = self._parse_row(item)
+        if old == new:
+            return
+        self._drop_point(old)
+        if new is not None:
+            bisect.insort(self._sorted_points, new)
+        self._row_points[item] = new
+
+    def _drop_point(self, point):
+        if point is None:
+            return
+        idx = bisect.bisect_left(self._sorted_points, point)
+        if idx < len(self._sorted_points) and self._sorted_points[idx] == point:
+            del self._sorted_points[idx]
 
     def update_graph(self):
         """Перерисовывает график на основе данных из таблицы."""
         if not self._temperature_dependent or not self.tree or not self.ax:
             return
-        points = []
-        for item in self.tree.get_children():
-            v = self.tree.set(item)
-            t_val = safe_float(v["temp"])
-            v_val = safe_float(v["value"])
-            if t_val is not None and v_val is not None:
-                points.append((t_val, v_val))
-
-        points.sort(key=lambda p: p[0])
+        self._row_points = {item: self._parse_row(item) for item in self.tree.get_children()}
+        self._sorted_points = sorted(p for p in self._row_points.values() if p is not None)
+        self._draw_points()
 
-        self.ax.clear()
+    def _draw_points(self):
+        points = self._sorted_points
         if points:
             ts, vs = zip(*points)
-            self.ax.plot(ts, vs, 'o-', markersize=4)
+            self._line.set_data(ts, vs)
+            self.ax.relim()
+            self.ax.autoscale(enable=True)
+        else:
+            self._line.set_data([], [])
+            self.ax.set_xlim(0, 1)
+            self.ax.set_ylim(0, 1)
 
         unit = self.unit_combo.get()
-        self.ax.set_ylabel(unit, fontsize=8)
-        self.ax.set_xlabel("T, °C", fontsize=8)
-        self.ax.grid(True, linestyle='--', alpha=0.6)
-        self.ax.tick_params(labelsize=8)
-        self.fig.tight_layout()
-        self.canvas.draw()
+        # tight_layout меряет текст всех подписей — пересчитываем раскладку, только когда
+        # меняется подпись оси Y, ширина подписей делений на ней или множитель оси,
+        # иначе позиция осей остаётся прежней
+        formatter = self.ax.yaxis.get_major_formatter()
+        tick_labels = formatter.format_ticks(self.ax.get_yticks())
+        layout_key = (unit, max(map(len, tick_labels), default=0), formatter.get_offset())
+        if layout_key != self._layout_key:
+            self._layout_key = layout_key
+            self.ax.set_ylabel(unit, fontsize=8)
+            self.fig.tight_layout()
+        if self._defer_draw:
+            self._draw_pending = True
+        else:
+            # Отрисовка откладывается до простоя: несколько правок подряд дают один draw
+            self._render(idle=True)
 
     def set_data(self, prop_data):
         """Заполняет поля данными из словаря (учитывает старый и новый формат источников)."""
@@ -4116,11 +4708,18 @@ class SinglePropertyEditor(ttk.Frame):
         self.comment_entry.insert(0, prop_data.get("comment", ""))
 
         if self._temperature_dependent:
-            for i in self.tree.get_children():
-                self.tree.delete(i)
-            for t, v in prop_data.get("temperature_value_pairs", []):
-                self.tree.insert("", "end", values=[t, v])
-            self.update_graph()
+            pairs = prop_data.get("temperature_value_pairs", [])
+            items = refill_treeview(self.tree, ([t, v] for t, v in pairs))
+            # Точки разбираем из исходных пар, а не перечитываем каждую строку из Tcl
+            row_points = {item: self._parse_point(t, v) for item, (t, v) in zip(items, pairs)}
+            was_empty = not self._sorted_points
+            self._row_points = row_points
+            self._sorted_points = sorted(p for p in row_points.values() if p is not None)
+            # Пустое свойство, уже нарисованное пустым с той же единицей, не перерисовываем
+            redundant = (was_empty and not self._sorted_points and self._layout_key is not None
+                         and self._layout_key[0] == self.unit_combo.get())
+            if self.ax and not redundant:
+                self._draw_points()
         elif self.scalar_value_entry is not None:
             self.scalar_value_entry.delete(0, tk.END)
             pairs = prop_data.get("temperature_value_pairs", [])
@@ -4134,13 +4733,13 @@ class SinglePropertyEditor(ttk.Frame):
         has_meta = bool(source_name or comment)
 
         if self._temperature_dependent:
+            # Строки, разобранные при заполнении/правке, берём из кэша; Tcl читаем только для новых
             pairs = []
+            row_points = self._row_points
             for item in self.tree.get_children():
-                v = self.tree.set(item)
-                t_val = safe_float(v["temp"])
-                v_val = safe_float(v["value"])
-                if t_val is not None and v_val is not None:
-                    pairs.append([t_val, v_val])
+                point = row_points[item] if item in row_points else self._parse_row(item)
+                if point is not None:
+                    pairs.append(list(point))
         else:
             pairs = []
             if self.scalar_value_entry is not None:
@@ -4284,27 +4883,33 @@ class GeneralDataTab(ttk.Frame, ScrollableMixin):
         self.class_entry.insert(0, cls.get("classification_class", ""))
         self.subclass_entry.delete(0, tk.END)
         self.subclass_entry.insert(0, cls.get("classification_subclass", ""))
-        for widget, var in self.area_widgets.values():
-            widget.destroy()
-        self.area_widgets.clear()
-        all_known_areas = set()
-        for mat_from_db in self.app_data.materials:
-            areas = mat_from_db.data.get("metadata", {}).get("application_area", [])
-            all_known_areas.update(areas)
+        # Объединение областей всех материалов уже собрано (и отсортировано) репозиторием;
+        # заново сортируем только если у материала есть ещё не сохранённые области
+        known_areas = self.app_data.application_areas
         current_material_areas = set(meta.get("application_area", []))
-        all_known_areas.update(current_material_areas)
-        sorted_areas = sorted(list(all_known_areas))
+        if current_material_areas.issubset(known_areas):
+            sorted_areas = known_areas
+        else:
+            sorted_areas = sorted(current_material_areas.union(known_areas))
 
-        canvas_widget = self.checkbox_container.master
+        # Флажки пересоздаются только при изменении набора областей;
+        # обычно он общий для всех материалов, и меняются лишь отметки
+        if list(self.area_widgets) != sorted_areas:
+            for widget, var in self.area_widgets.values():
+                widget.destroy()
+            self.area_widgets.clear()
 
-        for area in sorted_areas:
-            var = tk.BooleanVar()
-            if area in current_material_areas:
-                var.set(True)
-            cb = ttk.Checkbutton(self.checkbox_container, text=area, variable=var)
-            cb.pack(anchor="w", padx=5, pady=1)
-            self.bind_mouse_wheel(cb, canvas_widget)
-            self.area_widgets[area] = (cb, var)
+            canvas_widget = self.checkbox_container.master
+
+            for area in sorted_areas:
+                var = tk.BooleanVar()
+                cb = ttk.Checkbutton(self.checkbox_container, text=area, variable=var)
+                cb.pack(anchor="w", padx=5, pady=1)
+                self.bind_mouse_wheel(cb, canvas_widget)
+                self.area_widgets[area] = (cb, var)
+
+        for area, (widget, var) in self.area_widgets.items():
+            var.set(area in current_material_areas)
 
         temp_app_data = meta.get("temperature_application", {})
         self.temp_app_value_entry.delete(0, tk.END)
@@ -4317,6 +4922,7 @@ class GeneralDataTab(ttk.Frame, ScrollableMixin):
         meta["name_material_standard"] = self.name_entry.get()
         alt_names_str = self.alt_names_entry.get()
         meta["name_material_alternative"] = [name.strip() for name in alt_names_str.split(',') if name.strip()]
+        material.refresh_names()
         meta["comment"] = self.comment_entry.get().strip()
         cls = meta["classification"]
         cls["classification_category"] = self.cat_entry.get()
@@ -4397,9 +5003,10 @@ class PropertyEditorTab(ttk.Frame, ScrollableMixin):
             for editor in self.editors.values():
                 editor.set_source_manager(self.app_data.source_manager)
 
-        for prop_key, editor in self.editors.items():
-            p_data = material.get_physical_data(prop_key) or {}
-            editor.set_data(p_data)
+        with deferred_redraws(self.editors.values()):
+            for prop_key, editor in self.editors.items():
+                p_data = material.get_physical_data(prop_key) or {}
+                editor.set_data(p_data)
 
     def collect_data(self, material):
         """Собирает данные из всех редакторов в структуру материала."""
@@ -4422,6 +5029,11 @@ class MechanicalPropertiesTab(ttk.Frame, ScrollableMixin):
         self.editors = {}  # prop_key -> SinglePropertyEditor
         self.app_data = None
         self.source_map = {}
+        # Имена КП в порядке strength_groups — источник значений category_combo
+        self._category_names = []
+        # Были ли правки текущей КП с момента её загрузки в форму
+        self._dirty = False
+        self._edit_tag = f"MechEdit{id(self)}"
         self._setup_widgets()
 
     def set_app_data(self, app_data):
@@ -4500,7 +5112,7 @@ class MechanicalPropertiesTab(ttk.Frame, ScrollableMixin):
             frame = ttk.LabelFrame(scrollable_frame, text=f"{prop_info['name']} ({prop_info['symbol']})", padding=10)
             frame.pack(fill="x", expand=True, padx=10, pady=5)
 
-            editor = SinglePropertyEditor(frame, prop_key, prop_info)
+            editor = SinglePropertyEditor(frame, prop_key, prop_info, on_change=self._mark_dirty)
             editor.pack(fill="both", expand=True)
             self.editors[prop_key] = editor
 
@@ -4509,10 +5121,18 @@ class MechanicalPropertiesTab(ttk.Frame, ScrollableMixin):
         h_frame.pack(fill="x", expand=True, padx=10, pady=5)
         self.hardness_tree = self._create_hardness_table(h_frame)
 
+        # Любой пользовательский ввод в редакторе КП помечает её изменённой
+        for seq in ("<KeyRelease>", "<ButtonRelease>", "<<ComboboxSelected>>"):
+            self.bind_class(self._edit_tag, seq, self._mark_dirty)
+        add_bindtag_recursive(self.editor_content_frame, self._edit_tag)
+
         # --- ПРИВЯЗКА ВСЕХ ДЕТЕЙ ---
         # Вызываем для scrollable_frame, чтобы прокручивался prop_canvas
         self.after_idle(lambda: self.bind_all_children(scrollable_frame, prop_canvas))
 
+    def _mark_dirty(self, event=None):
+        self._dirty = True
+
     def _create_hardness_table(self, parent):
         top_h_frame = ttk.Frame(parent)
         top_h_frame.pack(fill="x", pady=(0, 5))
@@ -4525,7 +5145,7 @@ class MechanicalPropertiesTab(ttk.Frame, ScrollableMixin):
 
         t_frame = ttk.Frame(parent)
         t_frame.pack(fill="both", expand=True)
-        tree = create_editable_treeview(t_frame)
+        tree = create_editable_treeview(t_frame, on_update_callback=self._mark_dirty)
         tree.configure(show="headings")
         # Удалили столбец "Под-источник", оставляем только Min/Max
         tree["columns"] = ("min", "max")
@@ -4537,12 +5157,18 @@ class MechanicalPropertiesTab(ttk.Frame, ScrollableMixin):
 
         b_frame = ttk.Frame(t_frame)
         b_frame.pack(side="left", fill="y", padx=5)
-        ttk.Button(b_frame, text="+", width=2,
-                   command=lambda: tree.insert("", "end", values=["", ""])).pack(pady=2)
-        ttk.Button(b_frame, text="-", width=2,
-                   command=lambda: tree.delete(tree.selection())).pack(pady=2)
+        ttk.Button(b_frame, text="+", width=2, command=self._add_hardness_row).pack(pady=2)
+        ttk.Button(b_frame, text="-", width=2, command=self._delete_hardness_rows).pack(pady=2)
         return tree
 
+    def _add_hardness_row(self):
+        self.hardness_tree.insert("", "end", values=["", ""])
+
+    def _delete_hardness_rows(self):
+        selected = self.hardness_tree.selection()
+        if selected:
+            self.hardness_tree.delete(*selected)
+
     def populate_form(self, material):
         if self.material and self.material != material: self._save_current_category()
         self.material = material
@@ -4550,8 +5176,8 @@ class MechanicalPropertiesTab(ttk.Frame, ScrollableMixin):
         self._update_source_list()
 
         cats = material.get_strength_categories()
-        names = [Material.category_name(c) or f"КП {i + 1}" for i, c in enumerate(cats)]
-        self.category_combo["values"] = names
+        self._category_names = [Material.category_name(c) or f"КП {i + 1}" for i, c in enumerate(cats)]
+        self.category_combo["values"] = self._category_names
 
         if cats:
             self.editor_content_frame.pack(fill="both", expand=True)
@@ -4580,9 +5206,10 @@ class MechanicalPropertiesTab(ttk.Frame, ScrollableMixin):
         else:
             self.category_source_combo.set("")
 
-        for prop_key, editor in self.editors.items():
-            p_data = Material.get_category_prop_data(cat_data, prop_key) or {}
-            editor.set_data(p_data)
+        with deferred_redraws(self.editors.values()):
+            for prop_key, editor in self.editors.items():
+                p_data = Material.get_category_prop_data(cat_data, prop_key) or {}
+                editor.set_data(p_data)
 
         # Hardness Unit
         h_unit = Material.get_hardness_unit(cat_data)
@@ -4592,22 +5219,17 @@ class MechanicalPropertiesTab(ttk.Frame, ScrollableMixin):
         else:
             self.hardness_unit_combo.set("HB")
 
-        tree = self.hardness_tree
-        for i in tree.get_children():
-            tree.delete(i)
-        for h in Material.get_hardness_entries(cat_data):
-            tree.insert(
-                "", "end",
-                values=[
-                    h.get("min_value", ""),
-                    h.get("max_value", "")
-                ]
-            )
+        refill_treeview(
+            self.hardness_tree,
+            ([h.get("min_value", ""), h.get("max_value", "")]
+             for h in Material.get_hardness_entries(cat_data))
+        )
+        self._dirty = False
 
     def _add_category(self):
         if not self.material: return
         self._save_current_category()
-        new_name = f"Новая КП {len(self.category_combo['values']) + 1}"
+        new_name = f"Новая КП {len(self._category_names) + 1}"
         new_cat = Material.empty_strength_group(new_name)
 
         mech = self.material.ensure_group(Schema.TYPE_MECHANICAL)
@@ -4615,10 +5237,9 @@ class MechanicalPropertiesTab(ttk.Frame, ScrollableMixin):
             mech[Schema.STRENGTH_GROUPS] = []
         mech[Schema.STRENGTH_GROUPS].append(new_cat)
 
-        vals = list(self.category_combo['values'])
-        vals.append(new_name)
-        self.category_combo['values'] = vals
-        self.category_combo.current(len(vals) - 1)
+        self._category_names.append(new_name)
+        self.category_combo['values'] = self._category_names
+        self.category_combo.current(len(self._category_names) - 1)
         self._on_category_select()
 
     def _delete_category(self):
@@ -4626,11 +5247,12 @@ class MechanicalPropertiesTab(ttk.Frame, ScrollableMixin):
         if messagebox.askyesno("Подтверждение", "Удалить категорию?"):
             cats = self.material.get_strength_categories()
             del cats[self.current_category_idx]
+            del self._category_names[self.current_category_idx]
             self.current_category_idx = -1
             self.populate_form(self.material)
 
     def _save_current_category(self):
-        if not self.material or self.current_category_idx == -1:
+        if not self.material or self.current_category_idx == -1 or not self._dirty:
             return
         try:
             cat_data = self.material.get_strength_categories()[self.current_category_idx]
@@ -4652,16 +5274,17 @@ class MechanicalPropertiesTab(ttk.Frame, ScrollableMixin):
                 Material.set_category_prop_data(cat_data, prop_key, data)
             else:
                 Material.remove_category_prop_data(cat_data, prop_key)
+        self.material.invalidate_pairs_cache()
 
         current_h_unit = self.hardness_unit_combo.get()
         old_hardness = Material.get_hardness_entries(cat_data)
         h_list = []
         for idx, item in enumerate(self.hardness_tree.get_children()):
-            v = self.hardness_tree.set(item)
+            min_v, max_v = self.hardness_tree.item(item, "values")[:2]
             h = {
                 "unit_value": current_h_unit,
-                "min_value": safe_float(v.get("min")),
-                "max_value": safe_float(v.get("max"))
+                "min_value": safe_float(min_v),
+                "max_value": safe_float(max_v)
             }
             if idx < len(old_hardness):
                 old_sub = old_hardness[idx].get("property_subsource")
@@ -4678,9 +5301,11 @@ class MechanicalPropertiesTab(ttk.Frame, ScrollableMixin):
         else:
             Material.remove_category_prop_data(cat_data, Schema.HARDNESS)
 
-        vals = list(self.category_combo['values'])
-        vals[self.current_category_idx] = cat_data[Schema.STRENGTH_CAT]
-        self.category_combo['values'] = vals
+        new_name = cat_data[Schema.STRENGTH_CAT]
+        if self._category_names[self.current_category_idx] != new_name:
+            self._category_names[self.current_category_idx] = new_name
+            self.category_combo['values'] = self._category_names
+        self._dirty = False
 
     def collect_data(self, material):
         if self.material == material: self._save_current_category()
@@ -4747,6 +5372,11 @@ class ChemicalCompositionTab(ttk.Frame):
         "Ru": {"name": "Рутений", "color": "#708090"}
     }
 
+    # Позиции колонок elements_tree (name, elem, min, max, min_tol, max_tol) -> поля other_elements
+    _ELEM_COLUMN = 1
+    _FLOAT_KEYS = (("min_value", 2), ("max_value", 3))
+    _STR_KEYS = (("min_value_tolerance", 4), ("max_value_tolerance", 5))
+
     def __init__(self, parent):
         super().__init__(parent, padding=10)
         self.material = None
@@ -4765,6 +5395,10 @@ class ChemicalCompositionTab(ttk.Frame):
         self.fig = None
         self.ax = None
         self.canvas = None
+        self._chart_after_id = None
+        # Были ли правки текущего источника с момента его загрузки в форму
+        self._dirty = False
+        self._edit_tag = f"ChemEdit{id(self)}"
 
         # Для всплывающего окна
         self.popup_window = None
@@ -4843,7 +5477,7 @@ class ChemicalCompositionTab(ttk.Frame):
         self.base_element_entry = ttk.Combobox(meta_frame, values=["Fe", "Ti", "Cu"], width=10)
         self.base_element_entry.grid(row=2, column=1, sticky="w", padx=5, pady=2)
         self.base_element_entry.bind("<<ComboboxSelected>>", lambda e: self._update_chart())
-        self.base_element_entry.bind("<KeyRelease>", lambda e: self._update_chart())
+        self.base_element_entry.bind("<KeyRelease>", self._schedule_chart_update)
 
         ttk.Label(meta_frame, text="Ед. изм.:").grid(row=3, column=0, sticky="w")
         units = UnitManager.get_units("Безразмерный")
@@ -4868,12 +5502,24 @@ class ChemicalCompositionTab(ttk.Frame):
         right_pane.pack(side="right", fill="both", expand=True, padx=(5, 0))
         self._create_chart_panel(right_pane)
 
+        # Любой пользовательский ввод в редакторе источника помечает его изменённым
+        for seq in ("<KeyRelease>", "<ButtonRelease>", "<<ComboboxSelected>>"):
+            self.bind_class(self._edit_tag, seq, self._mark_dirty)
+        add_bindtag_recursive(self.editor_content_frame, self._edit_tag)
+
+    def _mark_dirty(self, event=None):
+        self._dirty = True
+
+    def _on_elements_edit(self):
+        self._dirty = True
+        self._update_chart()
+
     def _create_elements_table(self, parent_frame):
         table_frame = ttk.Frame(parent_frame)
         table_frame.pack(fill="both", expand=True)
         table_frame.columnconfigure(0, weight=1)
 
-        tree = create_editable_treeview(table_frame, on_update_callback=self._update_chart)
+        tree = create_editable_treeview(table_frame, on_update_callback=self._on_elements_edit)
         tree.configure(show="headings")
         tree["columns"] = ("name", "elem", "min", "max", "min_tol", "max_tol")
 
@@ -4948,7 +5594,16 @@ class ChemicalCompositionTab(ttk.Frame):
         cb_max.pack(side="left", padx=10)
 
     # === [Логика Графика] ===
+    def _schedule_chart_update(self, event=None):
+        """Перерисовка графика при наборе текста: через 150 мс после последнего нажатия."""
+        if self._chart_after_id:
+            self.after_cancel(self._chart_after_id)
+        self._chart_after_id = self.after(150, self._update_chart)
+
     def _update_chart(self):
+        if self._chart_after_id:
+            self.after_cancel(self._chart_after_id)
+            self._chart_after_id = None
         if not self.ax or not self.canvas: return
 
         self.ax.clear()
@@ -5076,13 +5731,9 @@ class ChemicalCompositionTab(ttk.Frame):
 
         # Заполняем элементами
         sorted_items = sorted(self.ELEMENTS_MAP.items(), key=lambda x: x[1]["name"])
-        items_data = []  # Храним (символ, имя) для доступа по индексу
-
-        for symbol, data in sorted_items:
-            name = data["name"]
-            display_text = f"{name} ({symbol})"
-            listbox.insert(tk.END, display_text)
-            items_data.append((symbol, name))
+        items_data = [(symbol, data["name"]) for symbol, data in sorted_items]  # (символ, имя) по индексу
+        if items_data:
+            listbox.insert(tk.END, *(f"{name} ({symbol})" for symbol, name in items_data))
 
         # Функция выбора
         def on_select(evt):
@@ -5098,7 +5749,7 @@ class ChemicalCompositionTab(ttk.Frame):
             self.elements_tree.item(row_id, values=current_values)
 
             # Обновляем график
-            self._update_chart()
+            self._on_elements_edit()
 
             self.popup_window.destroy()
             self.popup_window = None
@@ -5126,8 +5777,7 @@ class ChemicalCompositionTab(ttk.Frame):
         self.current_source_idx = -1
 
         compositions = material.get_compositions()
-        self.source_combo["values"] = [comp.get("composition_source", f"Источник {i + 1}") for i, comp in
-                                       enumerate(compositions)]
+        self._set_source_values(compositions)
 
         if compositions:
             self.source_combo.current(0)
@@ -5193,26 +5843,26 @@ class ChemicalCompositionTab(ttk.Frame):
         unit = first_elem.get("unit_value", "%")
         self.unit_combo.set(unit)
 
-        for i in self.elements_tree.get_children():
-            self.elements_tree.delete(i)
-
+        rows = []
         for elem in comp_data.get("other_elements", []):
             symbol = elem.get("element", "")
             name = self.ELEMENTS_MAP.get(symbol, {}).get("name", "")
-
-            self.elements_tree.insert(
-                "", "end",
-                values=[
-                    name,
-                    symbol,
-                    elem.get("min_value", ""),
-                    elem.get("max_value", ""),
-                    elem.get("min_value_tolerance", ""),
-                    elem.get("max_value_tolerance", "")
-                ]
-            )
+            rows.append([
+                name,
+                symbol,
+                elem.get("min_value", ""),
+                elem.get("max_value", ""),
+                elem.get("min_value_tolerance", ""),
+                elem.get("max_value_tolerance", "")
+            ])
+        refill_treeview(self.elements_tree, rows)
 
         self._update_chart()
+        self._dirty = False
+
+    def _set_source_values(self, compositions):
+        self.source_combo["values"] = [comp.get("composition_source", f"Источник {i + 1}") for i, comp in
+                                       enumerate(compositions)]
 
     def _add_source(self):
         if not self.material: return
@@ -5220,7 +5870,10 @@ class ChemicalCompositionTab(ttk.Frame):
         new_source = {"composition_source": "Новый источник", "other_elements": []}
         self.material.append_composition(new_source)
         compositions = self.material.get_compositions()
-        self.populate_form(self.material)
+        # Текущий источник уже сохранён: обновляем только список и сразу открываем новый,
+        # без промежуточного показа первого источника через populate_form
+        self.current_source_idx = -1
+        self._set_source_values(compositions)
         self.source_combo.current(len(compositions) - 1)
         self._on_source_select()
 
@@ -5232,7 +5885,7 @@ class ChemicalCompositionTab(ttk.Frame):
             self.populate_form(self.material)
 
     def _save_current_source(self):
-        if not self.material or self.current_source_idx == -1:
+        if not self.material or self.current_source_idx == -1 or not self._dirty:
             return
         try:
             compositions = self.material.get_compositions()
@@ -5273,27 +5926,27 @@ class ChemicalCompositionTab(ttk.Frame):
         common_unit = self.unit_combo.get()
 
         elements_list = []
-        for item_id in self.elements_tree.get_children():
-            values = self.elements_tree.set(item_id)
-            if not values.get("elem"):
+        tree = self.elements_tree
+        tree_item = tree.item
+        elem_col = self._ELEM_COLUMN
+        float_keys = self._FLOAT_KEYS
+        str_keys = self._STR_KEYS
+        for item_id in tree.get_children():
+            # Кортеж значений строки одним вызовом Tcl, без словаря колонок
+            values = tree_item(item_id, "values")
+            elem = values[elem_col]
+            if not elem:
                 continue
 
-            elem_data = {
-                "element": values["elem"],
-                "unit_value": common_unit
-            }
-
-            elem_data["min_value"] = safe_float(values["min"])
-            elem_data["max_value"] = safe_float(values["max"])
-
-            if values["min_tol"]:
-                elem_data["min_value_tolerance"] = values["min_tol"]
-            if values["max_tol"]:
-                elem_data["max_value_tolerance"] = values["max_tol"]
+            elem_data = {"element": elem, "unit_value": common_unit}
+            elem_data.update({key: safe_float(values[col]) for key, col in float_keys})
+            # Допуск 0 — значимая граница: отбрасываем только пустые ячейки, значения пишем строками
+            elem_data.update({key: str(values[col]) for key, col in str_keys if values[col] not in (None, "")})
 
             elements_list.append(elem_data)
 
         comp_data["other_elements"] = elements_list
+        self._dirty = False
         self._update_chart()
 
     def collect_data(self, material):
@@ -5416,7 +6069,7 @@ class EditorFrame(ttk.Frame):
                 if not isinstance(ch, dict):
                     continue
                 path = ch.get("path")
-                if isinstance(path, list) and path:
+                if isinstance(path, (list, tuple)) and path:
                     fields.add(".".join(str(p) for p in path if str(p)))
             return sorted(fields)
         except Exception:
@@ -5458,7 +6111,7 @@ class EditorFrame(ttk.Frame):
         mat_names = [m.get_display_name() for m in self.app_data.materials]
         self.mat_combo.config(values=mat_names)
 
-        if self.editing_copy and self.editing_copy.get_display_name() in mat_names:
+        if self.editing_copy and self.app_data.get_by_display_name(self.editing_copy.get_display_name()):
             self.mat_combo.set(self.editing_copy.get_display_name())
         else:
             self.editing_copy = None
@@ -5469,10 +6122,10 @@ class EditorFrame(ttk.Frame):
 
     def load_material(self, event=None):
         selected_name = self.mat_combo.get()
-        material = next((m for m in self.app_data.materials if m.get_display_name() == selected_name), None)
+        material = self.app_data.get_by_display_name(selected_name)
         if material:
             self.app_data.current_material = material
-            self.editing_copy = copy.deepcopy(material)
+            self.editing_copy = material.clone()
             self._populate_all_tabs()
             self._set_tabs_state("normal")
             self._update_button_states(True)  # Включаем кнопки
@@ -5560,9 +6213,7 @@ class EditorFrame(ttk.Frame):
                         "вкладки_с_изменениями": list(tab_groups.keys()),
                     },
                 )
-                messagebox.showinfo("Успех", f"Материал '{material_to_save.get_display_name()}' сохранен.")
-                # Вызываем перезагрузку данных через главный класс
-                self.main_app.open_directory(self.app_data.work_dir, show_success_message=False)
+                self.main_app.show_status(f"Материал '{material_to_save.get_display_name()}' сохранен.")
             except Exception:
                 self._audit_log(
                     event_name=AUDIT_EVENT_NAMES["MATERIAL_SAVE"],
@@ -5577,6 +6228,11 @@ class EditorFrame(ttk.Frame):
                     data={"операция": "save"},
                 )
                 messagebox.showerror("Ошибка сохранения", "Не удалось сохранить файл.")
+            else:
+                # Вне try: сбой обновления вкладок — не ошибка записи файла.
+                # Перечитываем только сохранённый файл, без обхода всей папки
+                self.app_data.reload_material(material_to_save.filepath)
+                self.main_app.on_data_load()
 
     def save_material_as(self):
         if not self.editing_copy:
@@ -5622,6 +6278,7 @@ class EditorFrame(ttk.Frame):
         if new_filepath:
             try:
                 # Обновляем рабочую директорию в app_data через main_app
+                prev_dir = self.app_data.work_dir
                 self.main_app.app_data.work_dir = os.path.dirname(new_filepath)
                 material_to_save.save(filepath=new_filepath)
                 tab_groups = self._audit_log_material_save_by_tabs(
@@ -5644,9 +6301,7 @@ class EditorFrame(ttk.Frame):
                         "вкладки_с_изменениями": list(tab_groups.keys()),
                     },
                 )
-                messagebox.showinfo("Успех", f"Материал сохранен как '{os.path.basename(new_filepath)}'.")
-                # Вызываем перезагрузку данных через главный класс
-                self.main_app.open_directory(self.app_data.work_dir, show_success_message=False)
+                self.main_app.show_status(f"Материал сохранен как '{os.path.basename(new_filepath)}'.")
             except Exception:
                 self._audit_log(
                     event_name=AUDIT_EVENT_NAMES["MATERIAL_SAVE_AS"],
@@ -5661,6 +6316,17 @@ class EditorFrame(ttk.Frame):
                     data={"операция": "save_as"},
                 )
                 messagebox.showerror("Ошибка сохранения", "Не удалось сохранить файл.")
+            else:
+                # Вне try: сбой обновления вкладок — не ошибка записи файла
+                same_dir = prev_dir and os.path.normcase(os.path.abspath(prev_dir)) == \
+                    os.path.normcase(os.path.abspath(self.app_data.work_dir))
+                if same_dir:
+                    # Файл в той же папке — дочитываем только его
+                    self.app_data.reload_material(new_filepath)
+                    self.main_app.on_data_load()
+                else:
+                    # Новая папка — загружаем её целиком через главный класс
+                    self.main_app.open_directory(self.app_data.work_dir, show_success_message=False)
         else:
             self._audit_log(
                 event_name=AUDIT_EVENT_NAMES["MATERIAL_SAVE_AS"],
@@ -5777,6 +6443,12 @@ class SourcesManagerTab(ttk.Frame):
         self._context_source_id = None    # ID источника для контекстного меню
         self._context_tree = None         # Treeview для контекстного меню
 
+        # Папка с файлами источников (относительные ссылки ищутся в ней)
+        self._sources_dir = os.path.join(get_app_directory(), "Источники")
+
+        # Таблицы устарели и будут перестроены при первом показе вкладки
+        self._view_dirty = True
+
         self._setup_widgets()
 
     # --- AUDIT (тихо) ---
@@ -5965,8 +6637,17 @@ class SourcesManagerTab(ttk.Frame):
 
     # === ОБНОВЛЕНИЕ ДАННЫХ ===
 
+    def mark_dirty(self):
+        """Помечает таблицы устаревшими; перестроение — при показе вкладки (refresh_if_dirty)."""
+        self._view_dirty = True
+
+    def refresh_if_dirty(self):
+        if self._view_dirty:
+            self.update_view()
+
     def update_view(self):
         """Обновляет таблицы во всех трёх вкладках данными из SourceService."""
+        self._view_dirty = False
         self._clear_form()
 
         for tree in self.trees.values():
@@ -5978,12 +6659,12 @@ class SourcesManagerTab(ttk.Frame):
         for group_key, tree in self.trees.items():
             sources = self.app_data.source_manager.get_all(group_key)
 
-            # Сортируем по имени
-            sources = list(sources)
-            sources.sort(key=lambda s: s.get("name_source", "").lower())
+            # Сортируем по имени: ключ (casefold, порядковый номер) считается один раз на источник
+            keyed = [(src.get("name_source", "").casefold(), i, src) for i, src in enumerate(sources)]
+            keyed.sort()
 
-            for src in sources:
-                values = (
+            rows = [
+                (src["id_source"], (
                     src.get("name_source", ""),
                     src.get("description", ""),
                     src.get("hyperlink", ""),
@@ -5991,8 +6672,17 @@ class SourcesManagerTab(ttk.Frame):
                     src.get("data_change", ""),
                     src.get("user_name_found", ""),
                     src.get("data_found", "")
-                )
-                tree.insert("", "end", iid=src["id_source"], values=values)
+                ))
+                for _, _, src in keyed
+            ]
+
+            # Заполняем скрытое дерево: одна перекомпоновка вместо пересчёта на каждую строку
+            tree.grid_remove()
+            try:
+                for iid, values in rows:
+                    tree.insert("", "end", iid=iid, values=values)
+            finally:
+                tree.grid()
 
     # === ВЫБОР СТРОКИ И РАБОТА С ФОРМОЙ ===
 
@@ -6102,7 +6792,7 @@ class SourcesManagerTab(ttk.Frame):
         # чтобы новый источник сразу был доступен для выбора
         if hasattr(self.main_app, "editor_frame"):
             self.main_app.editor_frame.refresh_sources_in_tabs()
-        messagebox.showinfo("Успех", "Источник создан.")
+        self.main_app.show_status("Источник создан.")
 
         self._audit_log(
             event_name=AUDIT_EVENT_NAMES["SOURCE_CREATE"],
@@ -6164,7 +6854,7 @@ class SourcesManagerTab(ttk.Frame):
             # чтобы переименованный источник сразу был виден
             if hasattr(self.main_app, "editor_frame"):
                 self.main_app.editor_frame.refresh_sources_in_tabs()
-            messagebox.showinfo("Успех", "Изменения сохранены.")
+            self.main_app.show_status("Изменения сохранены.")
 
             self._audit_log(
                 event_name=AUDIT_EVENT_NAMES["SOURCE_UPDATE"],
@@ -6218,45 +6908,8 @@ class SourcesManagerTab(ttk.Frame):
             t0 = None
 
         # 1. ПРОВЕРКА ИСПОЛЬЗОВАНИЯ В МАТЕРИАЛАХ
-        usage_count = 0
-        used_in = []
-
-        for mat in self.app_data.materials:
-            found = False
-            for prop in mat.get_physical_properties_list():
-                data = Material.get_prop_data(prop) or {}
-                if data.get("source_ref_id") == self.current_source_id:
-                    usage_count += 1
-                    used_in.append(mat.get_display_name())
-                    found = True
-                    break
-            if found:
-                continue
-
-            found_in_mech = False
-            for cat in mat.get_strength_categories():
-                if cat.get("source_ref_id") == self.current_source_id:
-                    usage_count += 1
-                    used_in.append(mat.get_display_name())
-                    found_in_mech = True
-                    break
-                for entry in cat.get(Schema.PROPERTIES) or []:
-                    data = Material.get_prop_data(entry) or {}
-                    if data.get("source_ref_id") == self.current_source_id:
-                        usage_count += 1
-                        used_in.append(mat.get_display_name())
-                        found_in_mech = True
-                        break
-                if found_in_mech:
-                    break
-            if found_in_mech:
-                continue
-
-            for comp in mat.get_compositions():
-                if comp.get("source_ref_id") == self.current_source_id:
-                    usage_count += 1
-                    used_in.append(mat.get_display_name())
-                    break
+        used_in = self.app_data.get_source_usage().get(self.current_source_id, [])
+        usage_count = len(used_in)
 
         src = None
         try:
@@ -6388,18 +7041,17 @@ class SourcesManagerTab(ttk.Frame):
 
         # Если это локальный путь и он относительный, пробуем найти в папке Источники
         if not os.path.isabs(link) and not link.lower().startswith(("http://", "https://")):
-            sources_dir = os.path.join(get_app_directory(), "Источники")
+            sources_dir = self._sources_dir
             potential_path = os.path.join(sources_dir, link)
-            if os.path.exists(potential_path):
+            if os.path.basename(link) == link:
+                # Простое имя файла — проверяем по кэшированному списку папки
+                if os.path.normcase(link) in list_dir_names(sources_dir):
+                    link = potential_path
+            elif path_exists_in(sources_dir, link):
                 link = potential_path
 
         try:
-            if sys.platform == "win32":
-                os.startfile(link)
-            elif sys.platform == "darwin":
-                subprocess.call(["open", link])
-            else:
-                subprocess.call(["xdg-open", link])
+            open_with_system(link)
             self._audit_log(
                 event_name=AUDIT_EVENT_NAMES["SOURCE_OPEN_LINK"],
                 event_category="Операция",
@@ -6441,10 +7093,15 @@ class MainApplication(tk.Tk):
         self._audit_session_t0 = None
         self._audit_session_finished = False
 
+        # Окна справки (filename -> Toplevel), переиспользуются между открытиями
+        self._text_windows = {}
+        # Таймер очистки строки состояния
+        self._status_after_id = None
+
         # Этот код для горячих клавиш можно оставить или убрать, если он не работает
-        self.bind_class("Entry", "<KeyPress>", self._handle_russian_hotkeys)
-        self.bind_class("Text", "<KeyPress>", self._handle_russian_hotkeys)
-        self.bind_class("ttk::Combobox", "<KeyPress>", self._handle_russian_hotkeys)
+        self.bind_class("Entry", "<KeyPress>", handle_russian_hotkeys)
+        self.bind_class("Text", "<KeyPress>", handle_russian_hotkeys)
+        self.bind_class("ttk::Combobox", "<KeyPress>", handle_russian_hotkeys)
 
         self.create_menu()
         self.create_widgets()
@@ -6508,7 +7165,8 @@ class MainApplication(tk.Tk):
             try:
                 nb.bind(
                     "<<NotebookTabChanged>>",
-                    lambda e, n=nb, c=container_name: self._audit_on_notebook_tab_changed(c, n)
+                    lambda e, n=nb, c=container_name: self._audit_on_notebook_tab_changed(c, n),
+                    add="+"
                 )
             except Exception:
                 pass
@@ -6608,26 +7266,6 @@ class MainApplication(tk.Tk):
         except Exception:
             pass
 
-    def _handle_russian_hotkeys(self, event):
-        is_ctrl_pressed = (event.state & 4) != 0
-        if is_ctrl_pressed:
-            key = event.keysym.lower()
-            if key == 'с':
-                event.widget.event_generate("<<Copy>>")
-                return "break"
-            elif key == 'м':
-                event.widget.event_generate("<<Paste>>")
-                return "break"
-            elif key == 'ч':
-                event.widget.event_generate("<<Cut>>")
-                return "break"
-            elif key == 'ф':
-                if isinstance(event.widget, tk.Text):
-                    event.widget.tag_add("sel", "1.0", "end")
-                elif isinstance(event.widget, tk.Entry):
-                    event.widget.selection_range(0, 'end')
-                return "break"
-
     def create_menu(self):
         self.menu_bar = tk.Menu(self)
         self.config(menu=self.menu_bar)
@@ -6645,6 +7283,11 @@ class MainApplication(tk.Tk):
         help_menu.add_command(label="Список изменений", command=self.show_change)
 
     def create_widgets(self):
+        # Строка состояния — до Notebook, чтобы при pack её место не занимала растянутая вкладка
+        self.status_var = tk.StringVar()
+        ttk.Label(self, textvariable=self.status_var, relief="sunken", anchor="w",
+                  padding=(5, 2)).pack(side="bottom", fill="x")
+
         self.main_notebook = ttk.Notebook(self)
         self.main_notebook.pack(expand=True, fill="both", padx=10, pady=10)
 
@@ -6655,6 +7298,23 @@ class MainApplication(tk.Tk):
         self.main_notebook.add(self.viewer_frame, text="Подбор материала")
         self.main_notebook.add(self.editor_frame, text="Добавление / Редактирование материала")
         self.main_notebook.add(self.sources_frame, text="Работа с источниками")
+        self.main_notebook.bind("<<NotebookTabChanged>>", self._on_main_tab_changed, add="+")
+
+    def show_status(self, text, timeout_ms=4000):
+        """Немодальное сообщение об успешной операции в строке состояния (гаснет через timeout_ms)."""
+        if self._status_after_id:
+            self.after_cancel(self._status_after_id)
+        self.status_var.set(text)
+        self._status_after_id = self.after(timeout_ms, self._clear_status)
+
+    def _clear_status(self):
+        self._status_after_id = None
+        self.status_var.set("")
+
+    def _on_main_tab_changed(self, event=None):
+        """Вкладка источников перестраивается лениво — только когда её показывают."""
+        if self.main_notebook.select() == str(self.sources_frame):
+            self.sources_frame.refresh_if_dirty()
 
     def open_directory(self, directory=None, show_success_message=True):
         # AUDIT: операция импорта (без путей)
@@ -6707,7 +7367,7 @@ class MainApplication(tk.Tk):
             try:
                 self.app_data.load_materials_from_dir(directory)
                 if show_success_message:
-                    messagebox.showinfo("Успех", f"Загружено {len(self.app_data.materials)} материалов.")
+                    self.show_status(f"Загружено {len(self.app_data.materials)} материалов.")
                 self.on_data_load()
 
                 # AUDIT: финиш импорта
@@ -6756,7 +7416,8 @@ class MainApplication(tk.Tk):
         self.app_data.current_material = None
         self.viewer_frame.update_view()
         self.editor_frame.update_view()
-        self.sources_frame.update_view()
+        self.sources_frame.mark_dirty()
+        self._on_main_tab_changed()
 
     def show_about_info(self):
         if self.audit_logger:
@@ -6784,23 +7445,7 @@ class MainApplication(tk.Tk):
             except Exception:
                 pass
 
-        instr_window = tk.Toplevel(self)
-        instr_window.title("Инструкция по использованию")
-        instr_window.geometry("750x600")
-        instr_window.minsize(500, 400)
-        instruction_text = read_text_from_file("instruction_list.txt")
-        text_frame = ttk.Frame(instr_window, padding=10)
-        text_frame.pack(fill="both", expand=True)
-        text_widget = tk.Text(text_frame, wrap=tk.WORD, state="disabled", font=("Arial", 10), padx=5, pady=5)
-        scrollbar = ttk.Scrollbar(text_frame, orient="vertical", command=text_widget.yview)
-        text_widget.config(yscrollcommand=scrollbar.set)
-        scrollbar.pack(side="right", fill="y")
-        text_widget.pack(side="left", fill="both", expand=True)
-        text_widget.config(state="normal")
-        text_widget.insert("1.0", instruction_text.strip())
-        text_widget.config(state="disabled")
-        ok_button = ttk.Button(instr_window, text="OK", command=instr_window.destroy)
-        ok_button.pack(pady=(0, 10))
+        self._show_text_window("Инструкция по использованию", "instruction_list.txt")
 
     def show_change(self):
         if self.audit_logger:
@@ -6813,23 +7458,44 @@ class MainApplication(tk.Tk):
             except Exception:
                 pass
 
-        instr_window = tk.Toplevel(self)
-        instr_window.title("Список изменений")
-        instr_window.geometry("750x600")
-        instr_window.minsize(500, 400)
-        instruction_text = read_text_from_file("change_list.txt")
-        text_frame = ttk.Frame(instr_window, padding=10)
+        self._show_text_window("Список изменений", "change_list.txt")
+
+    def _show_text_window(self, title, filename):
+        """
+        Окно с прокручиваемым текстом справочного файла.
+        Окно строится один раз на файл; закрытие его только скрывает.
+        """
+        text_window = self._text_windows.get(filename)
+        if text_window is not None and text_window.winfo_exists():
+            text_window.deiconify()
+            text_window.lift()
+            return
+
+        text_window = tk.Toplevel(self)
+        self._text_windows[filename] = text_window
+        text_window.title(title)
+        text_window.protocol("WM_DELETE_WINDOW", text_window.withdraw)
+        text_window.geometry("750x600")
+        text_window.minsize(500, 400)
+
+        text = read_text_from_file(filename)
+
+        text_frame = ttk.Frame(text_window, padding=10)
         text_frame.pack(fill="both", expand=True)
+
         text_widget = tk.Text(text_frame, wrap=tk.WORD, state="disabled", font=("Arial", 10), padx=5, pady=5)
         scrollbar = ttk.Scrollbar(text_frame, orient="vertical", command=text_widget.yview)
         text_widget.config(yscrollcommand=scrollbar.set)
+
         scrollbar.pack(side="right", fill="y")
         text_widget.pack(side="left", fill="both", expand=True)
+
         text_widget.config(state="normal")
-        text_widget.insert("1.0", instruction_text.strip())
+        text_widget.insert("1.0", text.strip())
         text_widget.config(state="disabled")
-        ok_button = ttk.Button(instr_window, text="OK", command=instr_window.destroy)
-        ok_button.pack(pady=(0, 10));
+
+        ok_button = ttk.Button(text_window, text="OK", command=text_window.withdraw)
+        ok_button.pack(pady=(0, 10))
 
 
 if __name__ == "__main__":
@@ -1,3 +1,7 @@
+from bisect import bisect_left
+from operator import itemgetter
+
+
 class MathUtils:
     """Утилиты для математических расчетов."""
 
@@ -12,15 +16,16 @@ class MathUtils:
             return default
 
     @staticmethod
-    def linear_interpolate(pairs, target_x):
+    def linear_interpolate(pairs, target_x, presorted=False):
         """
         Линейная интерполяция значения Y для target_x по списку пар [(x, y), ...].
         Не выполняет экстраполяцию (возвращает None).
+        presorted=True — пары уже отсортированы по X, повторная сортировка не нужна.
         """
         if not pairs: return None
 
         # Сортировка пар по X
-        sorted_pairs = sorted(pairs, key=lambda p: p[0])
+        sorted_pairs = pairs if presorted else sorted(pairs, key=itemgetter(0))
 
         # Проверка границ
         if target_x < sorted_pairs[0][0] or target_x > sorted_pairs[-1][0]:
@@ -38,4 +43,19 @@ class MathUtils:
                 if x2 - x1 == 0: return y1
                 return y1 + (target_x - x1) * (y2 - y1) / (x2 - x1)
 
-        return None
\ No newline at end of file
+        return None
+
+    @staticmethod
+    def interpolate_sorted(xs, sorted_pairs, target_x):
+        """
+        То же, что linear_interpolate, по заранее отсортированным парам и списку их X.
+        Интервал ищется бинарным поиском вместо перебора.
+        """
+        if not xs or target_x < xs[0] or target_x > xs[-1]:
+            return None
+        i = bisect_left(xs, target_x)
+        x2, y2 = sorted_pairs[i]
+        if x2 == target_x: return y2
+        x1, y1 = sorted_pairs[i - 1]
+        if x2 - x1 == 0: return y1
+        return y1 + (target_x - x1) * (y2 - y1) / (x2 - x1)
@@ -1,11 +1,16 @@
 import json
 import os
+import pickle
 from datetime import datetime
+from operator import itemgetter
 import uuid
 
 from src.core.schema_keys import Schema
 from src.core.math.interpolation import MathUtils
 
+# Буфер файлового ввода-вывода материалов
+IO_BUFFER_SIZE = 64 * 1024
+
 
 class Material:
     """
@@ -23,23 +28,51 @@ class Material:
     def __init__(self, filepath=None, data=None):
         self.filepath = filepath
         if filepath:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                self.data = json.load(f)
+            with open(filepath, 'rb', buffering=IO_BUFFER_SIZE) as f:
+                self.data = json.loads(f.read())
         elif data:
             self.data = data
         else:
             self.data = self.get_empty_structure()
         self.filename = os.path.basename(self.filepath) if self.filepath else "Новый материал.json"
+        # id(списка пар) -> (список, отсортированная копия, X копии); см. get_sorted_pairs
+        self._sorted_pairs_cache = {}
+        # id(списка пар) -> (список, числовые точки); см. get_numeric_points
+        self._numeric_points_cache = {}
         self.normalize_schema()
+        self.refresh_names()
+
+    def clone(self):
+        """
+        Независимая копия материала для редактирования.
+        Данные — простые dict/list/скаляры: pickle копирует их точно (как copy.deepcopy)
+        и примерно втрое быстрее, чем json.dumps/loads.
+        """
+        clone = Material(data=pickle.loads(pickle.dumps(self.data, pickle.HIGHEST_PROTOCOL)))
+        clone.filepath = self.filepath
+        clone.filename = self.filename
+        return clone
+
+    def refresh_names(self):
+        """
+        Пересчитывает кэшированные имена. Вызывать после правки metadata
+        (или замены self.data целиком) — иначе get_name/get_display_name вернут старые значения.
+        """
+        meta = self.data.get(Schema.METADATA, {})
+        std = meta.get(Schema.NAME_STD, "Без имени")
+        alts = [a.strip() for a in meta.get(Schema.NAME_ALT, []) if a.strip()]
+        self._name = std
+        self._display_name = f"{std} ({', '.join(alts)})" if alts else std
 
     def get_name(self):
-        return self.data.get(Schema.METADATA, {}).get(Schema.NAME_STD, "Без имени")
+        return self._name
 
     def get_display_name(self):
-        meta = self.data.get(Schema.METADATA, {})
-        std = meta.get(Schema.NAME_STD, "Без имени")
-        alts = [a.strip() for a in meta.get(Schema.NAME_ALT, []) if a.strip()]
-        return f"{std} ({', '.join(alts)})" if alts else std
+        """
+        Отображаемое имя 'стандартное (альтернативные)'. Значение кэшируется:
+        после правки metadata нужно вызвать refresh_names().
+        """
+        return self._display_name
 
     @staticmethod
     def get_empty_structure():
@@ -165,11 +198,13 @@ class Material:
         if not isinstance(props, list):
             props = []
         g[Schema.PROPERTIES] = self.upsert_named_prop(props, prop_name, data)
+        self.invalidate_pairs_cache()
 
     def remove_physical_data(self, prop_name):
         g = self.get_group(Schema.TYPE_PHYSICAL)
         if not g:
             return
+        self.invalidate_pairs_cache()
         g[Schema.PROPERTIES] = self.remove_named_prop(
             g.get(Schema.PROPERTIES, []), prop_name
         )
@@ -312,15 +347,20 @@ class Material:
         props.append({Schema.PROP_NAME: Schema.COMPOSITION, Schema.DATA: dict(data) if data else {}})
 
     def delete_composition_at(self, index):
-        entries = self.get_composition_entries()
-        if index < 0 or index >= len(entries):
+        """Удаляет index-й composition за один проход; порядок остальных сохраняется (он виден в UI)."""
+        if index < 0:
             return
-        target = entries[index]
         g = self.get_group(Schema.TYPE_CHEMICAL)
-        if not g:
+        if not g or not isinstance(g.get(Schema.PROPERTIES), list):
             return
-        props = g.get(Schema.PROPERTIES) or []
-        g[Schema.PROPERTIES] = [p for p in props if p is not target]
+        props = g[Schema.PROPERTIES]
+        seen = -1
+        for pos, item in enumerate(props):
+            if isinstance(item, dict) and item.get(Schema.PROP_NAME) == Schema.COMPOSITION:
+                seen += 1
+                if seen == index:
+                    del props[pos]
+                    return
 
     # ------------------------------------------------------------------
     # Lookup used by UI (raw material_data dict without Material instance)
@@ -356,10 +396,63 @@ class Material:
     # Interpolation / sources
     # ------------------------------------------------------------------
 
+    def get_sorted_pairs(self, prop_data):
+        """
+        temperature_value_pairs свойства, отсортированные по температуре.
+        Сортировка кэшируется по самому списку пар до invalidate_pairs_cache.
+        """
+        return self._sorted_entry(prop_data)[1]
+
+    def invalidate_pairs_cache(self):
+        """
+        Сбрасывает кэши по спискам пар. set_physical_data/remove_physical_data вызывают его сами;
+        после правки пар на месте или через статические *_category_prop_data — вызывать явно.
+        """
+        self._sorted_pairs_cache.clear()
+        self._numeric_points_cache.clear()
+
+    def _sorted_entry(self, prop_data):
+        pairs = prop_data.get(Schema.TEMP_PAIRS) or []
+        cached = self._sorted_pairs_cache.get(id(pairs))
+        if cached is not None and cached[0] is pairs:
+            return cached
+        result = sorted(pairs, key=itemgetter(0))
+        cached = (pairs, result, [p[0] for p in result])
+        if pairs:
+            self._sorted_pairs_cache[id(pairs)] = cached
+        return cached
+
+    def get_numeric_points(self, prop_data):
+        """
+        Пары свойства как список (t, v) из float, отсортированный по t; пары, где T или
+        значение не разбираются как число, отброшены. Кэшируется так же, как get_sorted_pairs,
+        чтобы вкладки расчёта и графиков не разбирали строки заново на каждый запрос.
+        """
+        pairs = prop_data.get(Schema.TEMP_PAIRS) or []
+        cached = self._numeric_points_cache.get(id(pairs))
+        if cached is not None and cached[0] is pairs:
+            return cached[1]
+        to_float = MathUtils.safe_float
+        points = []
+        for pair in pairs:
+            if len(pair) < 2:
+                continue
+            t, v = to_float(pair[0]), to_float(pair[1])
+            if t is not None and v is not None:
+                points.append((t, v))
+        points.sort(key=itemgetter(0))
+        if pairs:
+            self._numeric_points_cache[id(pairs)] = (pairs, points)
+        return points
+
+    def _interpolate(self, prop_data, temp):
+        _, sorted_pairs, xs = self._sorted_entry(prop_data)
+        return MathUtils.interpolate_sorted(xs, sorted_pairs, temp)
+
     def get_interpolated_property(self, prop_key, temp, category_idx=None):
         data = self.get_physical_data(prop_key)
         if data:
-            val = MathUtils.linear_interpolate(data.get(Schema.TEMP_PAIRS, []), temp)
+            val = self._interpolate(data, temp)
             if val is not None:
                 return val
 
@@ -372,11 +465,50 @@ class Material:
         for cat in target:
             data = self.get_category_prop_data(cat, prop_key)
             if data:
-                val = MathUtils.linear_interpolate(data.get(Schema.TEMP_PAIRS, []), temp)
+                val = self._interpolate(data, temp)
                 if val is not None:
                     return val
         return None
 
+    def get_interpolated_properties(self, prop_keys, temp, category_idx=None):
+        """
+        То же, что get_interpolated_property для каждого ключа из prop_keys, но группы
+        и списки свойств разбираются один раз на вызов, а не на каждый ключ.
+        Возвращает dict: ключ -> значение или None.
+        """
+        cats = self.get_strength_categories()
+        target = (
+            [cats[category_idx]]
+            if category_idx is not None and 0 <= category_idx < len(cats)
+            else cats
+        )
+        sources = [self._data_by_name(self.get_physical_properties_list())]
+        sources.extend(self._data_by_name(cat.get(Schema.PROPERTIES)) for cat in target if isinstance(cat, dict))
+
+        interpolate = self._interpolate
+        result = {}
+        for prop_key in prop_keys:
+            val = None
+            for by_name in sources:
+                data = by_name.get(prop_key)
+                if data:
+                    val = interpolate(data, temp)
+                    if val is not None:
+                        break
+            result[prop_key] = val
+        return result
+
+    @staticmethod
+    def _data_by_name(props):
+        """property_name -> data (как find_named_prop + get_prop_data: берётся первое вхождение)."""
+        by_name = {}
+        if isinstance(props, list):
+            for item in props:
+                if isinstance(item, dict):
+                    data = item.get(Schema.DATA)
+                    by_name.setdefault(item.get(Schema.PROP_NAME), data if isinstance(data, dict) else None)
+        return by_name
+
     def get_source_info(self, prop_type, prop_key=None, category_idx=None, source_manager=None):
         def resolve(container):
             if not isinstance(container, dict):
@@ -412,6 +544,17 @@ class Material:
 
         return "-"
 
+    def iter_source_refs(self):
+        """Все source_ref_id материала: физ. свойства, КП и их свойства, хим. составы."""
+        for entry in self.get_physical_properties_list():
+            yield (self.get_prop_data(entry) or {}).get(Schema.REF_ID)
+        for cat in self.get_strength_categories():
+            yield cat.get(Schema.REF_ID)
+            for entry in cat.get(Schema.PROPERTIES) or []:
+                yield (self.get_prop_data(entry) or {}).get(Schema.REF_ID)
+        for comp in self.get_compositions():
+            yield comp.get(Schema.REF_ID)
+
     # ------------------------------------------------------------------
     # Legacy → property_groups
     # ------------------------------------------------------------------
@@ -569,5 +712,9 @@ class Material:
                 if data is not None:
                     data["property_last_updated"] = now
 
-        with open(save_path, 'w', encoding='utf-8') as f:
-            json.dump(self.data, f, ensure_ascii=False, indent=2)
+        with open(save_path, 'wb', buffering=IO_BUFFER_SIZE) as f:
+            f.write(self._dump_bytes())
+
+    def _dump_bytes(self):
+        """JSON материала (UTF-8, отступ 2)."""
+        return json.dumps(self.data, ensure_ascii=False, indent=2).encode('utf-8')
@@ -4,21 +4,27 @@ from pathlib import Path
 _THIS_FILE = Path(__file__).resolve()
 
 
-def project_root() -> Path:
+def _resolve_root() -> Path:
     if getattr(sys, "frozen", False):
         return Path(sys.executable).resolve().parent
     return _THIS_FILE.parent.parent.parent
 
 
+# sys.frozen и расположение модуля во время работы не меняются — вычисляем корень один раз
+_APP_DIR = _resolve_root()
+
+
+def project_root() -> Path:
+    return _APP_DIR
+
+
 def config_dir() -> Path:
-    return project_root() / "config"
+    return _APP_DIR / "config"
 
 
 def docs_dir() -> Path:
-    return project_root() / "docs"
+    return _APP_DIR / "docs"
 
 
 def get_app_directory() -> Path:
-    if getattr(sys, "frozen", False):
-        return Path(sys.executable).resolve().parent
-    return project_root()
+    return _APP_DIR
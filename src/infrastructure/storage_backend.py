@@ -1,4 +1,5 @@
 import json
+import os
 from pathlib import Path
 
 SOURCE_JSON_NAME = "source.json"
@@ -19,12 +20,17 @@ class LocalDirectoryStorage:
         if not self._directory.is_dir():
             return []
 
-        paths = [
-            path
-            for path in self._directory.glob("*.json")
-            if path.name != SOURCE_JSON_NAME
-        ]
-        return sorted(paths, key=lambda p: p.name.lower())
+        # Один проход os.scandir: тип записи берётся из DirEntry без отдельного stat
+        with os.scandir(self._directory) as it:
+            names = [
+                entry.name
+                for entry in it
+                if entry.name.lower().endswith(".json")
+                and entry.name != SOURCE_JSON_NAME
+                and entry.is_file()
+            ]
+        names.sort(key=str.lower)
+        return [self._directory / name for name in names]
 
     def read_json(self, path: Path) -> dict:
         with open(path, encoding="utf-8") as f:
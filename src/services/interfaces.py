@@ -43,8 +43,13 @@ class MaterialRepository(Protocol):
     def load_materials_from_dir(self, directory: str | Path) -> None: ...
     def load_application_areas(self) -> None: ...
     def get_by_id(self, material_id: str): ...
+    def get_by_display_name(self, name: str): ...
+    def materials_in_area(self, area: str) -> list: ...
+    def get_source_usage(self) -> dict[str, list[str]]: ...
+    def invalidate_source_usage(self) -> None: ...
     def list_summary(self) -> list[dict]: ...
     def save_material(self, material) -> None: ...
+    def reload_material(self, filepath: str): ...
 
 
 @runtime_checkable
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import os
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from pathlib import Path
 
 from src.core.models.material import Material
@@ -8,6 +11,10 @@ from src.infrastructure.storage_backend import LocalDirectoryStorage
 from src.services.source_service import SourceService
 
 
+# Потоки для параллельного чтения файлов материалов
+MAX_LOAD_WORKERS = 16
+
+
 class MaterialRepository:
     """Состояние рабочей папки: материалы, области применения, источники."""
 
@@ -22,31 +29,62 @@ class MaterialRepository:
         self.current_material: Material | None = None
         self.source_manager = source_service or SourceService()
         self._storage = storage
+        self._source_usage: dict[str, list[str]] | None = None
+        self._by_display_name: dict[str, Material] | None = None
+        self._by_area: dict[str, list[Material]] | None = None
 
     def load_materials_from_dir(self, directory: str | Path) -> None:
         directory = Path(directory)
         self.work_dir = str(directory)
         self.materials.clear()
+        self._invalidate_indexes()
         self._storage = LocalDirectoryStorage(directory)
 
         if not directory.is_dir():
             self.application_areas = []
             return
 
-        for path in self._storage.list_material_paths():
-            try:
-                self.materials.append(Material(filepath=str(path)))
-            except Exception as e:
-                print(f"Ошибка чтения {path.name}: {e}")
+        paths = self._storage.list_material_paths()
+        if paths:
+            # Чтение файлов перекрывается в пуле потоков; порядок затем задаёт сортировка
+            with ThreadPoolExecutor(max_workers=min(MAX_LOAD_WORKERS, len(paths))) as pool:
+                loaded = pool.map(self._load_material, paths)
+                self.materials.extend(m for m in loaded if m is not None)
 
-        self.materials.sort(key=lambda m: m.get_display_name())
+        self.materials.sort(key=Material.get_display_name)
         self.load_application_areas()
 
+    @staticmethod
+    def _load_material(path: Path) -> Material | None:
+        try:
+            return Material(filepath=str(path))
+        except Exception as e:
+            print(f"Ошибка чтения {path.name}: {e}")
+            return None
+
     def load_application_areas(self) -> None:
-        all_areas: set[str] = set()
-        for m in self.materials:
-            all_areas.update(m.data.get(Schema.METADATA, {}).get(Schema.APP_AREA, []))
-        self.application_areas = sorted(all_areas)
+        self.application_areas = sorted(set(chain.from_iterable(
+            m.data.get(Schema.METADATA, {}).get(Schema.APP_AREA) or () for m in self.materials
+        )))
+
+    def get_by_display_name(self, name: str) -> Material | None:
+        """Материал по отображаемому имени (индекс строится лениво; при дублях — первый по списку)."""
+        if self._by_display_name is None:
+            index: dict[str, Material] = {}
+            for m in self.materials:
+                index.setdefault(m.get_display_name(), m)
+            self._by_display_name = index
+        return self._by_display_name.get(name)
+
+    def materials_in_area(self, area: str) -> list[Material]:
+        """Материалы с областью применения area, в порядке self.materials (индекс строится лениво)."""
+        if self._by_area is None:
+            index: dict[str, list[Material]] = {}
+            for m in self.materials:
+                for a in dict.fromkeys(m.data.get(Schema.METADATA, {}).get(Schema.APP_AREA) or ()):
+                    index.setdefault(a, []).append(m)
+            self._by_area = index
+        return self._by_area.get(area, [])
 
     def get_by_id(self, material_id: str) -> Material | None:
         for m in self.materials:
@@ -54,6 +92,27 @@ class MaterialRepository:
                 return m
         return None
 
+    def get_source_usage(self) -> dict[str, list[str]]:
+        """source_ref_id -> имена материалов, где он используется (строится лениво)."""
+        if self._source_usage is None:
+            usage: dict[str, list[str]] = {}
+            for m in self.materials:
+                name = m.get_display_name()
+                for ref in set(m.iter_source_refs()):
+                    if ref:
+                        usage.setdefault(ref, []).append(name)
+            self._source_usage = usage
+        return self._source_usage
+
+    def invalidate_source_usage(self) -> None:
+        self._source_usage = None
+
+    def _invalidate_indexes(self) -> None:
+        """Сбрасывает все ленивые индексы после изменения списка материалов."""
+        self.invalidate_source_usage()
+        self._by_display_name = None
+        self._by_area = None
+
     def list_summary(self) -> list[dict]:
         result = []
         for m in self.materials:
@@ -66,14 +125,33 @@ class MaterialRepository:
             })
         return result
 
+    def reload_material(self, filepath: str) -> Material | None:
+        """
+        Перечитывает один файл материала и подменяет его в списке (без обхода всей папки).
+        Возвращает новый объект или None, если файл не прочитался.
+        """
+        key = os.path.normcase(os.path.abspath(filepath))
+        self.materials[:] = [
+            m for m in self.materials
+            if not m.filepath or os.path.normcase(os.path.abspath(m.filepath)) != key
+        ]
+        material = self._load_material(Path(filepath))
+        if material is not None:
+            self.materials.append(material)
+        self.materials.sort(key=Material.get_display_name)
+        self._invalidate_indexes()
+        self.load_application_areas()
+        return material
+
     def save_material(self, material: Material) -> None:
         if not material.filepath:
             raise ValueError("Путь для сохранения не указан")
         material.save()
+        self._invalidate_indexes()
         if self._storage and not self._storage.exists(Path(material.filepath)):
             self.materials.append(material)
-            self.materials.sort(key=lambda m: m.get_display_name())
-            self.load_application_areas()
+            self.materials.sort(key=Material.get_display_name)
+        self.load_application_areas()
 
 
 AppData = MaterialRepository
@@ -0,0 +1,33 @@
+import pytest
+from matplotlib.figure import Figure
+
+main = pytest.importorskip("main")
+
+
+def _comparison_stub():
+    # Виджет не создаём: для пересчёта пределов нужны только оси и список линий сетки
+    tab = main.PropertyComparisonTab.__new__(main.PropertyComparisonTab)
+    tab.ax = Figure().add_subplot(111)
+    tab._minor_gridlines = []
+    return tab
+
+
+def _replot(tab, line, xs, ys):
+    line.set_data(xs, ys)
+    tab._rescale_axes(True)
+    tab._add_minor_gridlines()
+
+
+def test_rescale_ignores_previous_minor_gridlines():
+    """
+    Сценарий: график сравнения перестраивается с широкого диапазона данных на узкий
+    Ожидание: пределы сужаются — прежние линии промежуточной сетки не участвуют в relim
+    """
+    tab = _comparison_stub()
+    line, = tab.ax.plot([], [])
+    _replot(tab, line, [0, 1000], [0, 1000])
+    assert tab._minor_gridlines
+
+    _replot(tab, line, [20, 100], [20, 100])
+    x_min, x_max = tab.ax.get_xlim()
+    assert x_min >= 0 and x_max <= 120
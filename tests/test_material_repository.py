@@ -0,0 +1,40 @@
+"""Тесты репозитория материалов."""
+import os
+import tempfile
+import unittest
+
+from src.core.models.material import Material
+from src.core.schema_keys import Schema
+from src.services.material_repository import MaterialRepository
+
+
+class MaterialRepositoryTests(unittest.TestCase):
+    def test_reload_material_replaces_single_file(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            for name in ("Б", "В"):
+                mat = Material()
+                mat.data[Schema.METADATA][Schema.NAME_STD] = name
+                mat.data[Schema.METADATA][Schema.APP_AREA] = ["ТУ"]
+                mat.save(os.path.join(tmp, f"{name}.json"))
+            repo = MaterialRepository(source_service=object())
+            repo.load_materials_from_dir(tmp)
+            materials = repo.materials
+            self.assertEqual(repo.materials_in_area("ТУ")[0].get_display_name(), "Б")
+
+            edited = repo.get_by_display_name("В").clone()
+            edited.data[Schema.METADATA][Schema.NAME_STD] = "А"
+            edited.data[Schema.METADATA][Schema.APP_AREA] = ["ТУ", "Котлы"]
+            edited.save()
+            reloaded = repo.reload_material(edited.filepath)
+
+            self.assertIs(repo.materials, materials)
+            self.assertEqual([m.get_display_name() for m in repo.materials], ["А", "Б"])
+            self.assertIs(repo.get_by_display_name("А"), reloaded)
+            self.assertIsNone(repo.get_by_display_name("В"))
+            self.assertEqual(repo.application_areas, ["Котлы", "ТУ"])
+            self.assertEqual(repo.materials_in_area("ТУ")[0], reloaded)
+
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -62,6 +62,81 @@ class PropertyGroupsSchemaTests(unittest.TestCase):
         Material.set_hardness_entries(cat, [{"unit_value": "HB", "min_value": 1, "max_value": 2}], unit="HB")
         self.assertEqual(Material.get_hardness_entries(cat)[0]["max_value"], 2)
 
+    def test_interpolation_unsorted_pairs_cached(self):
+        mat = Material()
+        mat.set_physical_data("density", {Schema.TEMP_PAIRS: [[100.0, 7700.0], [20.0, 7800.0]]})
+        self.assertAlmostEqual(mat.get_interpolated_property("density", 60), 7750.0)
+        self.assertAlmostEqual(mat.get_interpolated_property("density", 100), 7700.0)
+        mat.set_physical_data("density", {Schema.TEMP_PAIRS: [[20.0, 7900.0], [100.0, 7900.0]]})
+        self.assertEqual(mat.get_interpolated_property("density", 60), 7900.0)
+        mat.get_physical_data("density")[Schema.TEMP_PAIRS][1] = [100.0, 7700.0]
+        mat.invalidate_pairs_cache()
+        self.assertAlmostEqual(mat.get_interpolated_property("density", 60), 7800.0)
+
+    def test_interpolated_properties_match_single_lookup(self):
+        mat = Material()
+        mat.set_physical_data("density", {Schema.TEMP_PAIRS: [[20.0, 7800.0], [100.0, 7700.0]]})
+        for name, value in (("КП1", 200.0), ("КП2", 300.0)):
+            cat = Material.empty_strength_group(name)
+            Material.set_category_prop_data(cat, "yield_strength", {Schema.TEMP_PAIRS: [[20.0, value]]})
+            mat.ensure_group(Schema.TYPE_MECHANICAL)[Schema.STRENGTH_GROUPS].append(cat)
+        keys = ("density", "yield_strength", "missing")
+        for idx in (None, 0, 1):
+            self.assertEqual(
+                mat.get_interpolated_properties(keys, 20, category_idx=idx),
+                {k: mat.get_interpolated_property(k, 20, category_idx=idx) for k in keys},
+            )
+        self.assertEqual(mat.get_interpolated_properties(keys, 20, category_idx=1)["yield_strength"], 300.0)
+
+    def test_numeric_points_parsed_once(self):
+        mat = Material()
+        mat.set_physical_data("density", {Schema.TEMP_PAIRS: [[100, "7700"], ["20,0", 7800], [50, None]]})
+        data = mat.get_physical_data("density")
+        points = mat.get_numeric_points(data)
+        self.assertEqual(points, [(20.0, 7800.0), (100.0, 7700.0)])
+        self.assertIs(mat.get_numeric_points(data), points)
+        data[Schema.TEMP_PAIRS][0][1] = "7600"
+        mat.invalidate_pairs_cache()
+        self.assertEqual(mat.get_numeric_points(data)[-1], (100.0, 7600.0))
+        mat.set_physical_data("density", {Schema.TEMP_PAIRS: [[200, 7500]]})
+        self.assertEqual(mat.get_numeric_points(mat.get_physical_data("density")), [(200.0, 7500.0)])
+
+    def test_delete_composition_at(self):
+        mat = Material()
+        for src in ("a", "b", "c"):
+            mat.append_composition({"composition_source": src})
+        mat.delete_composition_at(1)
+        mat.delete_composition_at(5)
+        self.assertEqual([c["composition_source"] for c in mat.get_compositions()], ["a", "c"])
+
+    def test_clone_is_independent(self):
+        mat = Material()
+        mat.filepath, mat.filename = "/tmp/x.json", "x.json"
+        mat.set_physical_data("density", {Schema.TEMP_PAIRS: [[20.0, 7900.0]]})
+        clone = mat.clone()
+        self.assertEqual(clone.data, mat.data)
+        self.assertEqual((clone.filepath, clone.filename), (mat.filepath, mat.filename))
+        clone.get_physical_data("density")[Schema.TEMP_PAIRS][0][1] = 1.0
+        self.assertEqual(mat.get_physical_data("density")[Schema.TEMP_PAIRS][0][1], 7900.0)
+
+    def test_refresh_names_after_metadata_edit(self):
+        mat = Material()
+        meta = mat.data[Schema.METADATA]
+        meta[Schema.NAME_STD], meta[Schema.NAME_ALT] = "12Х18Н10Т", [" AISI 321 ", ""]
+        mat.refresh_names()
+        self.assertEqual(mat.get_name(), "12Х18Н10Т")
+        self.assertEqual(mat.get_display_name(), "12Х18Н10Т (AISI 321)")
+
+    def test_iter_source_refs(self):
+        mat = Material()
+        mat.set_physical_data("density", {Schema.TEMP_PAIRS: [[20.0, 7900.0]], Schema.REF_ID: "p"})
+        cat = Material.empty_strength_group("КП2")
+        cat[Schema.REF_ID] = "s"
+        Material.set_category_prop_data(cat, "yield_strength", {Schema.REF_ID: "m"})
+        mat.ensure_group(Schema.TYPE_MECHANICAL)[Schema.STRENGTH_GROUPS].append(cat)
+        mat.append_composition({Schema.REF_ID: "c"})
+        self.assertEqual([r for r in mat.iter_source_refs() if r], ["p", "s", "m", "c"])
+
 
 if __name__ == "__main__":
     unittest.main()